@@ -4,8 +4,17 @@ import os
 from typing import Final
 from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+# Load environment variables from .env once, here — the single place the
+# parse actually happens (every entry point imports this module). Skipped
+# when the key material is already exported (the common production case,
+# and every respawned Uvicorn worker), avoiding a filesystem read and
+# parse per process start.
+if not (
+    os.getenv("GOOGLE_API_KEY")
+    and os.getenv("NOTION_API_KEY")
+    and os.getenv("ELEVENLABS_API_KEY")
+):
+    load_dotenv(override=False)
 
 # API Keys
 GOOGLE_API_KEY: Final[str] = os.getenv("GOOGLE_API_KEY", "")
@@ -17,6 +26,12 @@ ELEVENLABS_AGENT_A2A_URL: Final[str] = os.getenv("ELEVENLABS_AGENT_A2A_URL", "ht
 NOTION_AGENT_A2A_URL: Final[str] = os.getenv("NOTION_AGENT_A2A_URL", "http://localhost:8002")
 HOST_AGENT_A2A_URL: Final[str] = os.getenv("HOST_AGENT_A2A_URL", "http://localhost:8001")
 
+# Optional Unix domain socket paths for colocated agents. When set (and the
+# socket exists) the host agent talks to the child over AF_UNIX instead of
+# TCP loopback; the child must be started with a matching --uds option.
+ELEVENLABS_AGENT_A2A_UDS: Final[str] = os.getenv("ELEVENLABS_AGENT_A2A_UDS", "")
+NOTION_AGENT_A2A_UDS: Final[str] = os.getenv("NOTION_AGENT_A2A_UDS", "")
+
 # MCP Server Configurations
 NOTION_MCP_PORT: Final[int] = int(os.getenv("NOTION_MCP_PORT", "50051"))
 ELEVENLABS_MCP_PORT: Final[int] = int(os.getenv("ELEVENLABS_MCP_PORT", "50052"))
@@ -26,4 +41,6 @@ NOTION_MCP_REFERENCE: Final[str] = "notionApi"
 ELEVENLABS_MCP_REFERENCE: Final[str] = "elevenLabsApi"
 
 # ADK Configuration
-ADK_MODEL: Final[str] = os.getenv("ADK_MODEL", "gemini-2.0-flash")
\ No newline at end of file
+# LiteLLM-style "provider/model" id: ADK_MODEL feeds LiteLlm wrappers, so
+# the default carries the provider prefix.
+ADK_MODEL: Final[str] = os.getenv("ADK_MODEL", "gemini/gemini-2.0-flash")
\ No newline at end of file
@@ -9,7 +9,6 @@ from a2a.server.apps import A2AStarletteApplication
 from a2a.server.request_handlers import DefaultRequestHandler
 from a2a.server.tasks import InMemoryTaskStore
 from a2a.types import AgentCapabilities, AgentCard, AgentSkill
-from dotenv import load_dotenv
 
 # ADK imports
 from google.adk.artifacts import InMemoryArtifactService
@@ -19,68 +18,93 @@ from google.adk.sessions import InMemorySessionService
 
 from elevenlabs_agent.agent import create_elevenlabs_agent
 from elevenlabs_agent.agent_executor import ElevenLabsADKAgentExecutor
+from utils.fast_json import install_orjson_responses
+from utils.logging_setup import configure as configure_logging
 
-# Basic logging configuration
-logging.basicConfig(level=logging.INFO)
+# Basic logging configuration (once per process)
+configure_logging()
 logger = logging.getLogger(__name__)
 
+# .env is loaded (with the skip-when-exported guard) by the config module,
+# which the agent import above already pulled in; loading again here would
+# be a second parse of the same file.
+
+# Environment lookups cached once at import; os.getenv is not free and these
+# values cannot change for the lifetime of the process anyway.
+_DEFAULT_HOST = os.environ.get("A2A_ELEVENLABS_HOST", "localhost")
+_DEFAULT_PORT = int(os.environ.get("A2A_ELEVENLABS_PORT", "8003"))
+_ELEVENLABS_API_KEY = os.environ.get("ELEVENLABS_API_KEY")
+_GOOGLE_API_KEY = os.environ.get("GOOGLE_API_KEY")
+
+# Agent metadata validated once at import; main() only fills in the URL.
+_ELEVEN_SKILL = AgentSkill(
+    id="text_to_speech",
+    name="Convert text to speech",
+    description="Takes input text and returns an audio file of the spoken text using ElevenLabs.",
+    tags=["tts", "audio", "speech", "elevenlabs"],
+    examples=[
+        "Say 'Hello, world!'",
+        "Convert the following to speech: Today is a wonderful day.",
+    ],
+)
+
+_AGENT_CARD = AgentCard(
+    name="ElevenLabs TTS Agent",
+    description="Provides text-to-speech services using ElevenLabs.",
+    url="http://localhost/",  # Placeholder; the real URL is set in main()
+    version="1.0.0",
+    defaultInputModes=["text"],  # Agent primarily takes text
+    defaultOutputModes=[
+        "text",
+        "audio",
+    ],  # Agent primarily outputs audio (e.g., audio/mpeg)
+    capabilities=AgentCapabilities(
+        streaming=True, pushNotifications=False
+    ),  # Streaming here means A2A task events, not audio chunks
+    skills=[_ELEVEN_SKILL],
+)
+
 
 @click.command()
 @click.option(
     "--host",
     "host",
-    default=os.getenv("A2A_ELEVENLABS_HOST", "localhost"),
+    default=_DEFAULT_HOST,
     show_default=True,
     help="Host for the ElevenLabs agent server.",
 )
 @click.option(
     "--port",
     "port",
-    default=int(os.getenv("A2A_ELEVENLABS_PORT", 8003)),  # Adjusted default port
+    default=_DEFAULT_PORT,  # Adjusted default port
     show_default=True,
     type=int,
     help="Port for the ElevenLabs agent server.",
 )
-def main(host: str, port: int) -> None:
+@click.option(
+    "--uds",
+    "uds",
+    default=os.environ.get("A2A_ELEVENLABS_UDS", ""),
+    show_default=True,
+    help="Unix domain socket path to serve on instead of host/port "
+    "(skips the TCP loopback stack for colocated agents).",
+)
+def main(host: str, port: int, uds: str) -> None:
     # Check for required API keys
-    if not os.getenv("ELEVENLABS_API_KEY"):
+    if not _ELEVENLABS_API_KEY:
         logger.warning(
             "ELEVENLABS_API_KEY environment variable not set. "
             "The ElevenLabs MCP server might fail to authenticate."
         )
     
-    if not os.getenv("GOOGLE_API_KEY"):
+    if not _GOOGLE_API_KEY:
         logger.warning(
             "GOOGLE_API_KEY environment variable not set. "
             "The ElevenLabs agent might fail to initialize."
         )
 
-    eleven_skill = AgentSkill(
-        id="text_to_speech",
-        name="Convert text to speech",
-        description="Takes input text and returns an audio file of the spoken text using ElevenLabs.",
-        tags=["tts", "audio", "speech", "elevenlabs"],
-        examples=[
-            "Say 'Hello, world!'",
-            "Convert the following to speech: Today is a wonderful day.",
-        ],
-    )
-
-    agent_card = AgentCard(
-        name="ElevenLabs TTS Agent",
-        description="Provides text-to-speech services using ElevenLabs.",
-        url=f"http://{host}:{port}/",  # URL is dynamically set here
-        version="1.0.0",
-        defaultInputModes=["text"],  # Agent primarily takes text
-        defaultOutputModes=[
-            "text",
-            "audio",
-        ],  # Agent primarily outputs audio (e.g., audio/mpeg)
-        capabilities=AgentCapabilities(
-            streaming=False, pushNotifications=False
-        ),  # TTS is typically not streaming response
-        skills=[eleven_skill],
-    )
+    # model_copy skips revalidation, unlike constructing a fresh card.
+    agent_card = _AGENT_CARD.model_copy(update={"url": f"http://{host}:{port}/"})
 
     agent = create_elevenlabs_agent()
 
@@ -108,13 +132,53 @@ def main(host: str, port: int) -> None:
         http_handler=request_handler,
     )
 
-    logger.info(f"Starting ElevenLabs Agent server on http://{host}:{port}")
+    async def _warmup() -> None:
+        """Force the MCP stdio spawn + handshake before the first request.
+
+        Runs as a Starlette startup handler so the cached MCP session is
+        created on the serving event loop; doing this with a throwaway
+        asyncio.run() loop would leave the session bound to a closed loop.
+        """
+        try:
+            for toolset in agent.tools:
+                get_tools = getattr(toolset, "get_tools", None)
+                if get_tools is not None:
+                    await get_tools(None)
+            logger.info("ElevenLabs MCP toolset warmed up.")
+        except Exception as e:
+            logger.warning(
+                f"MCP warmup failed; the first request will pay the cold start: {e}"
+            )
+
+    if uds:
+        logger.info(f"Starting ElevenLabs Agent server on unix socket {uds}")
+    else:
+        logger.info(f"Starting ElevenLabs Agent server on http://{host}:{port}")
     logger.info(f"Agent Name: {agent_card.name}, Version: {agent_card.version}")
     if agent_card.skills:
         for skill in agent_card.skills:
             logger.info(f"  Skill: {skill.name} (ID: {skill.id}, Tags: {skill.tags})")
 
-    uvicorn.run(a2a_app.build(), host=host, port=port)
+    # Render JSON responses with orjson when available.
+    install_orjson_responses()
+
+    app = a2a_app.build()
+    app.add_event_handler("startup", _warmup)
+
+    # uvloop + httptools (bundled with uvicorn[standard]) cut event-loop and
+    # HTTP parsing overhead on the I/O-bound A2A path; the access log is
+    # disabled as it is a measurable per-request cost.
+    server_opts = {
+        "loop": "uvloop",
+        "http": "httptools",
+        "log_level": "warning",
+        "access_log": False,
+    }
+    if uds:
+        # AF_UNIX skips the kernel TCP stack for colocated A2A callers.
+        uvicorn.run(app, uds=uds, **server_opts)
+    else:
+        uvicorn.run(app, host=host, port=port, **server_opts)
 
 
 if __name__ == "__main__":
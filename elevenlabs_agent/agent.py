@@ -1,29 +1,47 @@
 """ElevenLabs Agent implementation using ADK and MCPToolset with custom timeout patch."""
 
 import os
+import shutil
+from functools import lru_cache
 
 from google.adk.agents import Agent
 from google.adk.models.lite_llm import LiteLlm
 from mcp import StdioServerParameters
 
-from config import ELEVENLABS_API_KEY, GOOGLE_API_KEY
+from config import ADK_MODEL, ELEVENLABS_API_KEY, GOOGLE_API_KEY
 from elevenlabs_agent.prompt import ELEVENLABS_PROMPT
 from utils.custom_adk_patches import CustomMCPToolset
 
+# Resolve the uvx launcher to an absolute path once at import. This skips the
+# PATH search on every MCP subprocess spawn; if uvx is not on PATH we keep the
+# bare name so the stdio client raises its usual, clearer error.
+_UVX_COMMAND = shutil.which("uvx") or "uvx"
 
+# Model selection comes from config.ADK_MODEL (the single source of truth
+# for the env var), a LiteLLM-style "provider/model" id; the matching API
+# key is picked by provider prefix so a single agent definition covers both
+# Gemini and Anthropic backends.
+_API_KEY = (
+    os.environ.get("ANTHROPIC_API_KEY")
+    if ADK_MODEL.startswith("anthropic/")
+    else GOOGLE_API_KEY
+)
+
+
+@lru_cache(maxsize=1)
 def create_elevenlabs_agent() -> Agent:
     return Agent(
         name="elevenlabs_agent_mcp",
         model=LiteLlm(
-            model="gemini/gemini-2.0-flash", 
-            api_key=GOOGLE_API_KEY
-        ),  
+            model=ADK_MODEL,
+            api_key=_API_KEY
+        ),
         description="Specialized agent for converting text to speech using ElevenLabs via MCPToolset.",
         instruction=ELEVENLABS_PROMPT,
         tools=[
             CustomMCPToolset(
                 connection_params=StdioServerParameters(
-                    command='uvx',
+                    command=_UVX_COMMAND,
                     args=['elevenlabs-mcp'], 
                     env={"ELEVENLABS_API_KEY": ELEVENLABS_API_KEY}
                 )
@@ -32,4 +50,10 @@ def create_elevenlabs_agent() -> Agent:
     ) 
 
 
-root_agent = create_elevenlabs_agent()
\ No newline at end of file
+# Required for ADK discovery. Materialized lazily so that merely importing
+# this module (e.g. from __main__.py, which calls the cached factory itself)
+# does not spawn the ElevenLabs MCP subprocess.
+def __getattr__(name: str) -> Agent:
+    if name == "root_agent":
+        return create_elevenlabs_agent()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -1,5 +1,6 @@
 import datetime
 import logging
+import secrets
 import uuid
 from collections.abc import AsyncGenerator
 
@@ -7,9 +8,11 @@ from a2a.server.agent_execution import AgentExecutor, RequestContext
 from a2a.server.events import EventQueue
 from a2a.types import (
     AgentCard,
+    Part,
     TaskState,
     TaskStatus,
     TaskStatusUpdateEvent,
+    TextPart,
 )
 from a2a.utils import new_agent_text_message
 from google.adk.agents import Agent
@@ -18,9 +21,34 @@ from google.adk.runners import Runner
 from google.adk.sessions import Session as ADKSession
 from google.genai import types as adk_types
 
-logging.basicConfig(level=logging.INFO)
+# Library module: do not configure root logging here; the entry points call
+# utils.logging_setup.configure() once per process.
 logger = logging.getLogger(__name__)
 
+# Hot-path lookups resolved once at import instead of per request.
+_UTC = datetime.timezone.utc
+
+# Validated once; responses are stamped out with model_copy, which skips
+# pydantic revalidation of the role/part structure on every send.
+_MESSAGE_TEMPLATE = new_agent_text_message(text="")
+
+
+def _make_user_content(text: str) -> adk_types.Content:
+    """Build the user-role Content wrapper for a request message."""
+    return adk_types.Content(role="user", parts=[adk_types.Part(text=text)])
+
+
+def _make_text_message(text: str, context_id: str | None, task_id: str | None):
+    """Build an agent text message from the pre-validated template."""
+    return _MESSAGE_TEMPLATE.model_copy(
+        update={
+            "messageId": uuid.uuid4().hex,
+            "parts": [Part(root=TextPart(text=text))],
+            "taskId": task_id,
+            "contextId": context_id,
+        }
+    )
+
 
 class ElevenLabsADKAgentExecutor(AgentExecutor):
     def __init__(self, agent: Agent, agent_card: AgentCard, runner: Runner):
@@ -71,7 +99,7 @@ class ElevenLabsADKAgentExecutor(AgentExecutor):
         logger.info(f"Cancelling task: {task_id} for agent {self.agent.name}")
 
         # Ensure datetime is timezone-aware (UTC)
-        timestamp = datetime.datetime.now(datetime.timezone.utc).isoformat()
+        timestamp = datetime.datetime.now(_UTC).isoformat()
 
         canceled_status = TaskStatus(
             state=TaskState.canceled,  # Use string or direct attribute
@@ -102,7 +130,9 @@ class ElevenLabsADKAgentExecutor(AgentExecutor):
     def _get_session_identifiers(self, context: RequestContext) -> tuple[str, str]:
         """Get user_id and session_id for ADK session management."""
         user_id = "a2a_user_notion"
-        session_id = context.task_id or str(uuid.uuid4())
+        # The fallback id only keys the in-process session map, so a short
+        # token is plenty; no need for a full UUID here.
+        session_id = context.task_id or secrets.token_hex(8)
         return user_id, session_id
 
     async def _ensure_adk_session(self, user_id: str, session_id: str) -> None:
@@ -123,37 +153,44 @@ class ElevenLabsADKAgentExecutor(AgentExecutor):
         self, user_input: str, user_id: str, session_id: str
     ) -> str:
         """Run the ADK agent and extract the final response."""
-        request_content = adk_types.Content(
-            role="user", parts=[adk_types.Part(text=user_input)]
-        )
+        request_content = _make_user_content(user_input)
 
-        logger.debug(f"Running ADK agent {self.agent.name} with session {session_id}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Running ADK agent {self.agent.name} with session {session_id}"
+            )
         events_async: AsyncGenerator[Event, None] = self.runner.run_async(
             user_id=user_id, session_id=session_id, new_message=request_content
         )
 
         final_message_text = "(No search results found)"
 
-        async for event in events_async:
-            if (
-                event.is_final_response()
-                and event.content
-                and event.content.role == "model"
-            ):
-                if event.content.parts and event.content.parts[0].text:
-                    final_message_text = event.content.parts[0].text
-                    logger.info(
-                        f"{self.agent.name} final response: '{final_message_text[:200]}{'...' if len(final_message_text) > 200 else ''}'"
-                    )
-                    break
-                else:
+        try:
+            async for event in events_async:
+                if (
+                    event.is_final_response()
+                    and event.content
+                    and event.content.role == "model"
+                ):
+                    if event.content.parts and event.content.parts[0].text:
+                        final_message_text = event.content.parts[0].text
+                        logger.info(
+                            f"{self.agent.name} final response: '{final_message_text[:200]}{'...' if len(final_message_text) > 200 else ''}'"
+                        )
+                        break
+                    else:
+                        logger.warning(
+                            f"{self.agent.name} received final event but no text in first part: {event.content.parts}"
+                        )
+                elif event.is_final_response():
                     logger.warning(
-                        f"{self.agent.name} received final event but no text in first part: {event.content.parts}"
+                        f"{self.agent.name} received final event without model content: {event}"
                     )
-            elif event.is_final_response():
-                logger.warning(
-                    f"{self.agent.name} received final event without model content: {event}"
-                )
+        finally:
+            # Breaking out of the loop leaves the ADK generator suspended;
+            # close it promptly so the runner releases its resources instead
+            # of waiting for garbage collection.
+            await events_async.aclose()
 
         return final_message_text
 
@@ -163,7 +200,7 @@ class ElevenLabsADKAgentExecutor(AgentExecutor):
         """Send the response back via the event queue."""
         logger.info(f"Sending Notion search response for task {context.task_id}")
         event_queue.enqueue_event(
-            new_agent_text_message(
+            _make_text_message(
                 text=message_text,
                 context_id=context.context_id,
                 task_id=context.task_id,
@@ -183,7 +220,7 @@ class ElevenLabsADKAgentExecutor(AgentExecutor):
         )
         error_message_text = f"Error searching Notion workspace: {str(error)}"
         event_queue.enqueue_event(
-            new_agent_text_message(
+            _make_text_message(
                 text=error_message_text,
                 context_id=context.context_id,
                 task_id=context.task_id,
@@ -11,11 +11,9 @@ from a2a.server.apps import A2AStarletteApplication
 from a2a.server.request_handlers import DefaultRequestHandler
 from a2a.server.tasks import InMemoryTaskStore
 from a2a.types import AgentCapabilities, AgentCard, AgentSkill
-from dotenv import load_dotenv
 
 # ADK imports
 from google.adk.artifacts import InMemoryArtifactService
-from google.adk.memory.in_memory_memory_service import InMemoryMemoryService
 from google.adk.runners import Runner
 from google.adk.sessions import InMemorySessionService
 
@@ -23,76 +21,78 @@ from host_agent.agent import create_host_agent
 
 # Local agent imports
 from host_agent.agent_executor import HostADKAgentExecutor
+from utils.fast_json import install_orjson_responses
+from utils.logging_setup import configure as configure_logging
 
-# Load environment variables from .env file
-load_dotenv()
+# .env is loaded (with the skip-when-exported guard) by the config module,
+# which the agent import above already pulled in; loading again here would
+# be a second parse of the same file.
 
-# Basic logging configuration
-logging.basicConfig(level=logging.INFO)
+# Basic logging configuration (once per process)
+configure_logging()
 logger = logging.getLogger(__name__)
 
-
-@click.command()
-@click.option(
-    "--host",
-    "host",
-    default=os.getenv("A2A_HOST_HOST", "0.0.0.0"),
-    show_default=True,
-    help="Host for the Host agent server.",
+# Environment lookups cached once at import; os.getenv is not free and these
+# values cannot change for the lifetime of the process anyway.
+_DEFAULT_HOST = os.environ.get("A2A_HOST_HOST", "0.0.0.0")
+_DEFAULT_PORT = int(os.environ.get("A2A_HOST_PORT", "8001"))
+_DEFAULT_WORKERS = int(os.environ.get("WEB_CONCURRENCY", "1"))
+_GOOGLE_API_KEY = os.environ.get("GOOGLE_API_KEY")
+
+# Agent metadata validated once at import; build_app() only fills in the URL.
+_ORCHESTRATION_SKILL = AgentSkill(
+    id="orchestrate_workflows",
+    name="Orchestrate Multi-Agent Workflows",
+    description="Coordinates Notion information retrieval and ElevenLabs text-to-speech generation.",
+    tags=["orchestration", "workflow", "coordination", "multi-agent"],
+    examples=[
+        "Search Notion for project updates and convert to speech",
+        "Find meeting notes and generate audio summary",
+        "Retrieve documentation and create audio version",
+    ],
 )
-@click.option(
-    "--port",
-    "port",
-    default=int(os.getenv("A2A_HOST_PORT", 8001)),
-    show_default=True,
-    type=int,
-    help="Port for the Host agent server.",
+
+_AGENT_CARD = AgentCard(
+    name="Host Agent Orchestrator",
+    description="Orchestrates Notion and ElevenLabs agents via A2A protocol for information retrieval and text-to-speech workflows.",
+    url="http://localhost/",  # Placeholder; the real URL is set in build_app()
+    version="1.0.0",
+    defaultInputModes=["text"],
+    defaultOutputModes=["text"],
+    capabilities=AgentCapabilities(streaming=False, pushNotifications=False),
+    skills=[_ORCHESTRATION_SKILL],
 )
-def main(host: str, port: int) -> None:
-    """Runs the Host ADK Agent as an A2A service."""
 
-    # Check for required API keys
-    if not os.getenv("GOOGLE_API_KEY"):
-        logger.warning(
-            "GOOGLE_API_KEY environment variable not set. "
-            "The Host agent might fail to initialize."
-        )
 
-    # Define AgentCard for Host Agent
-    orchestration_skill = AgentSkill(
-        id="orchestrate_workflows",
-        name="Orchestrate Multi-Agent Workflows",
-        description="Coordinates Notion information retrieval and ElevenLabs text-to-speech generation.",
-        tags=["orchestration", "workflow", "coordination", "multi-agent"],
-        examples=[
-            "Search Notion for project updates and convert to speech",
-            "Find meeting notes and generate audio summary",
-            "Retrieve documentation and create audio version",
-        ],
-    )
+def build_app():
+    """Build the Host Agent A2A Starlette application.
 
-    agent_card = AgentCard(
-        name="Host Agent Orchestrator",
-        description="Orchestrates Notion and ElevenLabs agents via A2A protocol for information retrieval and text-to-speech workflows.",
-        url=f"http://{host}:{port}/",
-        version="1.0.0",
-        defaultInputModes=["text"],
-        defaultOutputModes=["text"],
-        capabilities=AgentCapabilities(streaming=False, pushNotifications=False),
-        skills=[orchestration_skill],
-    )
+    Used as a Uvicorn application factory so that each worker process
+    constructs its own agent, runner, and request handler. Host and port
+    for the agent card URL are read from the environment, which `main()`
+    populates from the CLI options before starting the server.
+
+    Returns:
+        The ASGI application for the Host agent.
+    """
+    host = os.getenv("A2A_HOST_HOST", "0.0.0.0")
+    port = int(os.getenv("A2A_HOST_PORT", 8001))
+
+    # model_copy skips revalidation, unlike constructing a fresh card.
+    agent_card = _AGENT_CARD.model_copy(update={"url": f"http://{host}:{port}/"})
 
     try:
         # Create the actual ADK Agent
         adk_agent = create_host_agent()
 
-        # Initialize the ADK Runner (following official ADK pattern)
+        # Initialize the ADK Runner (following official ADK pattern). No
+        # memory service: the host agent only wires delegation tools and
+        # never touches memory primitives.
         runner = Runner(
             app_name=agent_card.name,
             agent=adk_agent,
             artifact_service=InMemoryArtifactService(),
             session_service=InMemorySessionService(),
-            memory_service=InMemoryMemoryService(),
         )
 
         # Instantiate the AgentExecutor with the runner
@@ -102,7 +102,7 @@ def main(host: str, port: int) -> None:
 
     except Exception as e:
         logger.error(f"Failed to initialize Host Agent components: {e}", exc_info=True)
-        return
+        raise
 
     # Set up the A2A request handler
     request_handler = DefaultRequestHandler(
@@ -114,14 +114,82 @@ def main(host: str, port: int) -> None:
         agent_card=agent_card, http_handler=request_handler
     )
 
-    logger.info(f"🌟 Starting Host Agent A2A Server on port {port}")
-    logger.info(f"Agent Name: {agent_card.name}, Version: {agent_card.version}")
-    if agent_card.skills:
+    # Render JSON responses with orjson when available. Done in the factory
+    # so every worker process gets the patch.
+    install_orjson_responses()
+
+    # ASCII-only, %-deferred formatting: the handler encodes and builds the
+    # string only if the record is actually emitted.
+    logger.info("Starting Host Agent A2A Server on port %d", port)
+    logger.info(
+        "Agent Name: %s, Version: %s", agent_card.name, agent_card.version
+    )
+    if logger.isEnabledFor(logging.DEBUG) and agent_card.skills:
         for skill in agent_card.skills:
-            logger.info(f"  Skill: {skill.name} (ID: {skill.id}, Tags: {skill.tags})")
+            logger.debug(
+                "  Skill: %s (ID: %s, Tags: %s)", skill.name, skill.id, skill.tags
+            )
+
+    return a2a_app.build()
+
 
-    # Run the Uvicorn server
-    uvicorn.run(a2a_app.build(), host=host, port=port)
+@click.command()
+@click.option(
+    "--host",
+    "host",
+    default=_DEFAULT_HOST,
+    show_default=True,
+    help="Host for the Host agent server.",
+)
+@click.option(
+    "--port",
+    "port",
+    default=_DEFAULT_PORT,
+    show_default=True,
+    type=int,
+    help="Port for the Host agent server.",
+)
+@click.option(
+    "--workers",
+    "workers",
+    default=_DEFAULT_WORKERS,
+    show_default=True,
+    type=int,
+    help=(
+        "Number of Uvicorn worker processes. With workers > 1, the in-memory "
+        "task and session stores are per-process, so clients need sticky "
+        "routing (or an external store) for multi-turn conversations."
+    ),
+)
+def main(host: str, port: int, workers: int) -> None:
+    """Runs the Host ADK Agent as an A2A service."""
+
+    # Check for required API keys
+    if not _GOOGLE_API_KEY:
+        logger.warning(
+            "GOOGLE_API_KEY environment variable not set. "
+            "The Host agent might fail to initialize."
+        )
+
+    # Worker processes re-import this module and call build_app(), so pass
+    # the CLI-selected host/port through the environment for the card URL.
+    os.environ["A2A_HOST_HOST"] = host
+    os.environ["A2A_HOST_PORT"] = str(port)
+
+    # Run the Uvicorn server on uvloop + httptools (bundled with
+    # uvicorn[standard]) for lower event-loop and HTTP parsing overhead;
+    # the access log is disabled as it is a measurable per-request cost.
+    uvicorn.run(
+        "host_agent.__main__:build_app",
+        factory=True,
+        host=host,
+        port=port,
+        workers=workers,
+        loop="uvloop",
+        http="httptools",
+        log_level="warning",
+        access_log=False,
+    )
 
 
 if __name__ == "__main__":
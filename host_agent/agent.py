@@ -1,13 +1,16 @@
 """Host Agent implementation using ADK with a generic A2A delegation tool."""
 
+from functools import lru_cache
+
 from google.adk.agents import Agent
 from google.adk.models.lite_llm import LiteLlm
 
 from config import GOOGLE_API_KEY
 from host_agent.prompt import HOST_PROMPT
-from host_agent.tools import delegate_task_sync
+from host_agent.tools import delegate_task, delegate_tasks
 
 
+@lru_cache(maxsize=1)
 def create_host_agent() -> Agent:
     """Creates an ADK agent that orchestrates child agents via a generic delegation tool.
 
@@ -24,10 +27,16 @@ def create_host_agent() -> Agent:
         description="A master orchestrator that delegates tasks to specialized child agents (Notion, ElevenLabs) using a generic A2A communication tool.",
         instruction=HOST_PROMPT,
         tools=[
-            delegate_task_sync,
+            delegate_task,
+            delegate_tasks,
         ],
     )
 
 
-# Required for ADK discovery
-root_agent = create_host_agent()
+# Required for ADK discovery. Materialized lazily so that merely importing
+# this module (e.g. from __main__.py or the UIs, which call the cached
+# factory themselves) does not build a second agent.
+def __getattr__(name: str) -> Agent:
+    if name == "root_agent":
+        return create_host_agent()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -18,8 +18,8 @@ from google.adk.runners import Runner
 from google.adk.sessions import Session as ADKSession
 from google.genai import types as adk_types
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Library module: do not configure root logging here; the entry points call
+# utils.logging_setup.configure() once per process.
 logger = logging.getLogger(__name__)
 
 
@@ -1,23 +1,96 @@
 """Remote connections for A2A client communication following the architecture pattern."""
 
 import asyncio
-from typing import Any, Dict
+import random
+from collections import defaultdict
+from typing import Any, DefaultDict, Dict
 from uuid import uuid4
 
 import httpx
-from a2a.client import A2AClient
+from a2a.client import A2ACardResolver, A2AClient
 from a2a.types import (
+    AgentCard,
     GetTaskRequest,
     GetTaskResponse,
     GetTaskSuccessResponse,
+    Message,
     MessageSendParams,
+    Part,
     SendMessageRequest,
     SendMessageResponse,
     SendMessageSuccessResponse,
+    SendStreamingMessageRequest,
     TaskQueryParams,
+    TaskState,
+    TextPart,
 )
 
 
+# JSON-RPC request IDs only need per-connection uniqueness for response
+# correlation, not crypto strength; uuid4() pays an OS CSPRNG read per call,
+# which adds up across poll iterations. One urandom-seeded PRNG covers them.
+# messageId keeps uuid4, since it must be unique across processes.
+_request_id_rng = random.Random()
+
+
+def _next_request_id() -> str:
+    """Return a cheap 64-bit hex correlation ID for JSON-RPC requests."""
+    return f"{_request_id_rng.getrandbits(64):016x}"
+
+
+def _artifact_parts(artifact_item: Any) -> Any:
+    """Return the parts list of an artifact, typed model or dict alike."""
+    if isinstance(artifact_item, dict):
+        parts = artifact_item.get("parts")
+    else:
+        parts = getattr(artifact_item, "parts", None)
+    return parts or ()
+
+
+def _iter_part_texts(part: Any):
+    """Yield the text and audio-URL strings carried by one artifact part."""
+    if isinstance(part, dict):
+        text = part.get("text")
+        audio_url = part.get("audio_url")
+    else:
+        # Part is a RootModel wrapper; unwrap once and read the fields.
+        root = getattr(part, "root", part)
+        text = getattr(root, "text", None)
+        audio_url = getattr(root, "audio_url", None)
+    if text:
+        yield text
+    if audio_url:
+        yield f"Audio URL: {audio_url}"
+
+
+def create_message_send_params(
+    text: str, task_id: str | None = None, context_id: str | None = None
+) -> MessageSendParams:
+    """Build MessageSendParams directly from the concrete A2A types.
+
+    Constructing the models avoids building a nested payload dict only for
+    ``MessageSendParams(**payload)`` to re-parse it — one validator pass and
+    one allocation per message instead of two.
+
+    Args:
+        text: The message text to send
+        task_id: Optional task ID to associate with the message
+        context_id: Optional context ID for conversation context
+
+    Returns:
+        MessageSendParams: The prepared send-message parameters
+    """
+    return MessageSendParams(
+        message=Message(
+            role="user",
+            parts=[Part(root=TextPart(text=text))],
+            messageId=uuid4().hex,
+            taskId=task_id,
+            contextId=context_id,
+        )
+    )
+
+
 class RemoteConnections:
     """Handles A2A connections and communication with downstream agents.
 
@@ -35,6 +108,14 @@ class RemoteConnections:
             httpx_client: The async HTTP client to use for A2A communication
         """
         self.httpx_client = httpx_client
+        # Agent cards rarely change, so the resolved (client, card) pair is
+        # cached per URL; this halves the HTTP round-trips per delegation.
+        # The card rides alongside the client because A2AClient keeps only
+        # the RPC URL from it. Entries are invalidated on connection errors.
+        self._client_cache: Dict[str, tuple[A2AClient, AgentCard]] = {}
+        self._client_locks: DefaultDict[str, asyncio.Lock] = defaultdict(
+            asyncio.Lock
+        )
 
     @classmethod
     async def create(cls, timeout: float = 30.0) -> "RemoteConnections":
@@ -46,13 +127,38 @@ class RemoteConnections:
         Returns:
             RemoteConnections: Configured instance
         """
-        httpx_client = httpx.AsyncClient(timeout=timeout)
+        # HTTP/2 multiplexes concurrent A2A calls over one connection when
+        # the server speaks it; httpx falls back to HTTP/1.1 otherwise.
+        httpx_client = httpx.AsyncClient(
+            timeout=timeout,
+            http2=True,
+            limits=httpx.Limits(
+                max_keepalive_connections=32, max_connections=128
+            ),
+        )
         return cls(httpx_client)
 
     async def close(self) -> None:
         """Close the underlying httpx client."""
         await self.httpx_client.aclose()
 
+    async def prewarm(self, agent_urls) -> None:
+        """Resolve A2A clients for the given URLs ahead of first use.
+
+        Fetching each agent card now pays the DNS lookup, TCP handshake
+        and card round-trip up front, so the first real delegation finds
+        a warm keep-alive connection and a cached client. Failures are
+        swallowed: an agent that is down at prewarm time is simply
+        resolved again on its first actual delegation.
+
+        Args:
+            agent_urls: Iterable of agent base URLs to warm.
+        """
+        await asyncio.gather(
+            *(self._get_client(url) for url in agent_urls),
+            return_exceptions=True,
+        )
+
     async def invoke_agent(self, agent_url: str, query: str) -> Dict[str, Any]:
         """Invoke a downstream agent via A2A protocol.
 
@@ -66,16 +172,23 @@ class RemoteConnections:
             - {"error": "error message"} for failures
         """
         try:
-            # Create A2A client from agent card
-            client = await A2AClient.get_client_from_agent_card_url(
-                self.httpx_client, agent_url
-            )
+            # Reuse the cached A2A client and its agent card for this URL
+            client, card = await self._get_client(agent_url)
+
+            send_params = create_message_send_params(query)
+
+            # Prefer streaming when the agent advertises it: one request and
+            # a stream of events replaces the send + N polling round-trips.
+            try:
+                streamed = await self._invoke_agent_streaming(client, card, send_params)
+            except Exception:
+                # Any streaming hiccup falls back to the polling path below.
+                streamed = None
+            if streamed is not None:
+                return streamed
 
             # Send A2A message
-            send_payload = self._create_send_message_payload(query)
-            request = SendMessageRequest(
-                id=str(uuid4()), params=MessageSendParams(**send_payload)
-            )
+            request = SendMessageRequest(id=_next_request_id(), params=send_params)
 
             send_response: SendMessageResponse = await client.send_message(request)
 
@@ -107,37 +220,98 @@ class RemoteConnections:
             }
 
         except httpx.ConnectError:
+            # A stale cached client is useless once the connection drops;
+            # the next invocation re-resolves the agent card.
+            self._client_cache.pop(agent_url, None)
             return {
                 "error": f"Could not connect to agent at {agent_url}. Ensure the server is running."
             }
+        except httpx.HTTPStatusError:
+            self._client_cache.pop(agent_url, None)
+            return {"error": f"HTTP error calling agent at {agent_url}"}
         except Exception as e:
             return {"error": f"Error calling agent at {agent_url}: {str(e)}"}
 
-    def _create_send_message_payload(
-        self, text: str, task_id: str | None = None, context_id: str | None = None
-    ) -> Dict[str, Any]:
-        """Create A2A send message payload with proper format.
+    async def _get_client(self, agent_url: str) -> tuple[A2AClient, AgentCard]:
+        """Return the cached (client, card) pair, resolving it on first use.
+
+        The card is resolved explicitly via A2ACardResolver and cached
+        next to the client: A2AClient.__init__ keeps only the RPC URL
+        from the card it is given, so callers that need capability
+        checks (e.g. streaming support) must get the card from here. A
+        per-URL lock keeps concurrent first calls from fetching it more
+        than once.
 
         Args:
-            text: The message text to send
-            task_id: Optional task ID to associate with the message
-            context_id: Optional context ID for conversation context
+            agent_url: The URL of the target A2A agent
 
         Returns:
-            dict: Properly formatted A2A message payload
+            The client built from the agent's card, and the card itself
         """
-        payload: Dict[str, Any] = {
-            "message": {
-                "role": "user",
-                "parts": [{"text": text}],
-                "messageId": uuid4().hex,
-            },
-        }
-        if task_id:
-            payload["message"]["taskId"] = task_id
-        if context_id:
-            payload["message"]["contextId"] = context_id
-        return payload
+        entry = self._client_cache.get(agent_url)
+        if entry is not None:
+            return entry
+
+        async with self._client_locks[agent_url]:
+            entry = self._client_cache.get(agent_url)
+            if entry is None:
+                card = await A2ACardResolver(
+                    self.httpx_client, agent_url
+                ).get_agent_card()
+                client = A2AClient(self.httpx_client, agent_card=card)
+                entry = (client, card)
+                self._client_cache[agent_url] = entry
+        return entry
+
+    async def _invoke_agent_streaming(
+        self, client: A2AClient, card: AgentCard, send_params: MessageSendParams
+    ) -> Dict[str, Any] | None:
+        """Invoke an agent over A2A streaming, if it supports it.
+
+        Args:
+            client: The A2A client to stream through
+            card: The agent's resolved card, carrying its capabilities
+            send_params: The prepared send-message parameters
+
+        Returns:
+            Dict with result or error, or None when the agent card does not
+            advertise streaming (caller falls back to send + poll).
+        """
+        capabilities = getattr(card, "capabilities", None)
+        if not getattr(capabilities, "streaming", False):
+            return None
+        if not hasattr(client, "send_message_streaming"):
+            return None
+
+        request = SendStreamingMessageRequest(
+            id=_next_request_id(), params=send_params
+        )
+
+        collected: list[str] = []
+        async for response in client.send_message_streaming(request):
+            # Handle wrapped response structure
+            payload = response.root if hasattr(response, "root") else response
+            result = getattr(payload, "result", None)
+            if result is None:
+                continue
+
+            text = self._extract_immediate_response(result)
+            if text:
+                collected.append(text)
+
+            # TaskState is a plain Enum in a2a-sdk 0.2.5, so compare
+            # members, not strings (a string compare is always False).
+            status = getattr(result, "status", None)
+            state = getattr(status, "state", None)
+            if state == TaskState.failed:
+                message = getattr(status, "message", None)
+                return {"error": message or "Task failed"}
+            if getattr(result, "final", False) or state == TaskState.completed:
+                break
+
+        if collected:
+            return {"result": "\n".join(collected)}
+        return {"result": "No content received"}
 
     def _extract_immediate_response(self, agent_reply_data: Any) -> str | None:
         """Extract immediate response content from agent reply.
@@ -148,34 +322,24 @@ class RemoteConnections:
         Returns:
             str: Extracted text content, or None if not found
         """
-        try:
-            # Check for immediate response content (many A2A agents return results directly)
-            if hasattr(agent_reply_data, "parts") and agent_reply_data.parts:
-                immediate_results = []
-                for part in agent_reply_data.parts:
-                    # Try to extract text from part structure
-                    text_content = None
-
-                    # Check for part.root.text (most common pattern)
-                    if hasattr(part, "root") and hasattr(part.root, "text"):
-                        text_content = getattr(part.root, "text", None)
-                    # Fallback to direct part.text
-                    elif hasattr(part, "text"):
-                        text_content = getattr(part, "text", None)
-
-                    if text_content and isinstance(text_content, str):
-                        immediate_results.append(text_content)
-
-                if immediate_results:
-                    return "\n".join(immediate_results)
-
-            # Check if the response itself has text content
-            if hasattr(agent_reply_data, "text") and agent_reply_data.text:
-                return str(agent_reply_data.text)
-
-        except (AttributeError, TypeError):
-            # If immediate parsing fails, return None to try task polling
-            pass
+        # Check for immediate response content (many A2A agents return
+        # results directly). Part is a RootModel wrapper, so unwrap once and
+        # dispatch on the concrete type instead of a hasattr ladder.
+        parts = getattr(agent_reply_data, "parts", None)
+        if parts:
+            immediate_results = []
+            for part in parts:
+                root = getattr(part, "root", part)
+                if isinstance(root, TextPart) and root.text:
+                    immediate_results.append(root.text)
+
+            if immediate_results:
+                return "\n".join(immediate_results)
+
+        # Check if the response itself has text content
+        text = getattr(agent_reply_data, "text", None)
+        if isinstance(text, str) and text:
+            return text
 
         return None
 
@@ -189,11 +353,10 @@ class RemoteConnections:
             str: Task ID if found, None otherwise
         """
         # Handle both Pydantic models and dict responses for task ID
-        if hasattr(agent_reply_data, "taskId"):
-            task_id_value = getattr(agent_reply_data, "taskId", None)
-            if isinstance(task_id_value, str):
-                return task_id_value
-        elif isinstance(agent_reply_data, dict):
+        task_id_value = getattr(agent_reply_data, "taskId", None)
+        if isinstance(task_id_value, str):
+            return task_id_value
+        if isinstance(agent_reply_data, dict):
             task_id_value = agent_reply_data.get("taskId")
             if isinstance(task_id_value, str):
                 return task_id_value
@@ -205,6 +368,12 @@ class RemoteConnections:
     ) -> Dict[str, Any]:
         """Poll for task completion and extract results.
 
+        Polls with exponential backoff and full jitter: fast tasks are
+        caught by the early sub-100ms probes, slow tasks back off toward
+        the cap, and the jitter keeps concurrent callers from hammering
+        the downstream agent in synchronized waves. The loop is bounded
+        by a wall-clock budget rather than an attempt count.
+
         Args:
             client: The A2A client to use for polling
             task_id: The task ID to poll
@@ -212,13 +381,28 @@ class RemoteConnections:
         Returns:
             Dict with result or error
         """
-        max_retries = 10
-        retry_delay = 2  # seconds
+        base_delay = 0.05  # seconds
+        max_delay = 2.0  # seconds
+        budget = 30.0  # seconds of wall clock before giving up
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + budget
+
+        async def _backoff(attempt: int) -> bool:
+            """Sleep with jittered backoff; False once the budget is spent."""
+            if loop.time() >= deadline:
+                return False
+            await asyncio.sleep(
+                random.uniform(0, min(max_delay, base_delay * (2**attempt)))
+            )
+            return True
 
-        for attempt in range(max_retries):
+        attempt = 0
+        while True:
+            attempt += 1
             try:
                 get_request = GetTaskRequest(
-                    id=str(uuid4()), params=TaskQueryParams(id=task_id)
+                    id=_next_request_id(), params=TaskQueryParams(id=task_id)
                 )
                 get_response: GetTaskResponse = await client.get_task(get_request)
 
@@ -228,36 +412,29 @@ class RemoteConnections:
                 ):
                     actual_task_result = get_response.result
                     if actual_task_result.status:
+                        # TaskState members, not strings: the enum is not a
+                        # str subclass in a2a-sdk 0.2.5.
                         task_status = actual_task_result.status.state
 
-                        if task_status == "completed":
+                        if task_status == TaskState.completed:
                             # Extract artifacts
                             if actual_task_result.artifacts:
-                                # Collect all text and audio URLs from artifacts
-                                results = []
-                                for artifact_item in actual_task_result.artifacts:
-                                    if isinstance(artifact_item, dict):
-                                        parts_list = artifact_item.get("parts")
-                                        if isinstance(parts_list, list):
-                                            for part_data in parts_list:
-                                                if isinstance(part_data, dict):
-                                                    text = part_data.get("text")
-                                                    audio_url = part_data.get(
-                                                        "audio_url"
-                                                    )
-                                                    if text:
-                                                        results.append(text)
-                                                    if audio_url:
-                                                        results.append(
-                                                            f"Audio URL: {audio_url}"
-                                                        )
+                                # Artifacts arrive as typed models; the
+                                # helpers keep a single dict fallback instead
+                                # of nested isinstance checks per part.
+                                results = [
+                                    text
+                                    for artifact_item in actual_task_result.artifacts
+                                    for part in _artifact_parts(artifact_item)
+                                    for text in _iter_part_texts(part)
+                                ]
 
                                 if results:
                                     return {"result": "\n".join(results)}
                                 else:
                                     return {"result": "No content received"}
 
-                        elif task_status == "failed":
+                        elif task_status == TaskState.failed:
                             error_msg = (
                                 actual_task_result.status.message
                                 if actual_task_result.status.message
@@ -265,23 +442,15 @@ class RemoteConnections:
                             )
                             return {"error": error_msg}
 
-                        elif task_status in ["pending", "running"]:
-                            if attempt < max_retries - 1:
-                                await asyncio.sleep(retry_delay)
+                        elif task_status in (TaskState.submitted, TaskState.working):
+                            if await _backoff(attempt):
                                 continue
-                            else:
-                                return {"error": "Task did not complete within timeout"}
+                            return {"error": "Task did not complete within timeout"}
 
                 # If we get here, the response wasn't as expected
-                if attempt < max_retries - 1:
-                    await asyncio.sleep(retry_delay)
-                else:
+                if not await _backoff(attempt):
                     return {"error": "Task polling failed - unexpected response format"}
 
             except Exception as e:
-                if attempt < max_retries - 1:
-                    await asyncio.sleep(retry_delay)
-                else:
+                if not await _backoff(attempt):
                     return {"error": f"Task polling error: {str(e)}"}
-
-        return {"error": "Task did not complete within timeout"}
@@ -5,15 +5,20 @@ any task to a named child agent.
 """
 
 import asyncio
+import atexit
 import os
-import sys
-from typing import Dict
+import threading
+from typing import Dict, List, Optional
 
-from config import ELEVENLABS_AGENT_A2A_URL, NOTION_AGENT_A2A_URL
-from host_agent.remote_connections import RemoteConnections
+import httpx
 
-# Add project root to the Python path to resolve module import errors
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from config import (
+    ELEVENLABS_AGENT_A2A_UDS,
+    ELEVENLABS_AGENT_A2A_URL,
+    NOTION_AGENT_A2A_UDS,
+    NOTION_AGENT_A2A_URL,
+)
+from host_agent.remote_connections import RemoteConnections
 
 # Mapping of agent names to their URLs. In a more dynamic system,
 # this could come from a service discovery mechanism.
@@ -22,6 +27,81 @@ AGENT_URL_MAP: Dict[str, str] = {
     "elevenlabs_agent": ELEVENLABS_AGENT_A2A_URL,
 }
 
+# Precomputed so the unknown-agent path allocates nothing per call.
+_AGENT_NAMES = frozenset(AGENT_URL_MAP)
+_UNKNOWN_AGENT_SUFFIX = f"Available agents are: {sorted(AGENT_URL_MAP)}"
+
+# Optional AF_UNIX socket per agent URL: colocated agents skip the TCP
+# loopback stack entirely when the child was started with --uds.
+_AGENT_UDS_MAP: Dict[str, str] = {
+    NOTION_AGENT_A2A_URL: NOTION_AGENT_A2A_UDS,
+    ELEVENLABS_AGENT_A2A_URL: ELEVENLABS_AGENT_A2A_UDS,
+}
+
+
+def _uds_mounts() -> Dict[str, httpx.AsyncHTTPTransport]:
+    """Build per-URL UDS transport mounts for agents with a live socket.
+
+    Agents without a configured path, or whose socket file does not exist
+    (e.g. the child was started on TCP after all), fall back to the default
+    TCP transport automatically.
+    """
+    return {
+        url: httpx.AsyncHTTPTransport(uds=uds)
+        for url, uds in _AGENT_UDS_MAP.items()
+        if uds and os.path.exists(uds)
+    }
+
+# Shared RemoteConnections singleton for all delegations. One keep-alive
+# httpx pool means repeated calls to the same child agent skip the TCP
+# handshake, and the per-URL A2AClient cache inside RemoteConnections
+# survives across calls instead of being rebuilt each time.
+_remote: Optional[RemoteConnections] = None
+_remote_lock = asyncio.Lock()
+
+
+def _close_remote() -> None:
+    """Best-effort shutdown of the shared connection pool at interpreter exit."""
+    if _remote is not None:
+        try:
+            asyncio.run(_remote.close())
+        except Exception:
+            pass
+
+
+async def _get_remote() -> RemoteConnections:
+    """Return the shared RemoteConnections, creating it on first use."""
+    global _remote
+    if _remote is None:
+        async with _remote_lock:
+            if _remote is None:
+                _remote = RemoteConnections(
+                    httpx.AsyncClient(
+                        timeout=60.0,  # Increased timeout for complex tasks
+                        http2=True,  # Multiplex batch delegations when supported
+                        limits=httpx.Limits(
+                            max_keepalive_connections=32,
+                            max_connections=128,
+                            keepalive_expiry=60.0,
+                        ),
+                        mounts=_uds_mounts() or None,
+                    )
+                )
+                atexit.register(_close_remote)
+    return _remote
+
+
+async def prewarm_connections() -> None:
+    """Warm the shared pool's connections to every child agent.
+
+    Embedding UIs schedule this in the background at runner construction
+    so the first delegation of the first user turn skips cold DNS, TCP
+    and agent-card fetches. Safe to call with agents still booting; the
+    prewarm ignores failures.
+    """
+    remote = await _get_remote()
+    await remote.prewarm(AGENT_URL_MAP.values())
+
 
 async def delegate_task(agent_name: str, task_description: str) -> str:
     """Delegates a task to a specified child agent via A2A protocol.
@@ -33,13 +113,12 @@ async def delegate_task(agent_name: str, task_description: str) -> str:
     Returns:
         The result from the child agent, or an error message.
     """
-    if agent_name not in AGENT_URL_MAP:
-        return f"Error: Agent '{agent_name}' is not a known agent. Available agents are: {list(AGENT_URL_MAP.keys())}"
+    if agent_name not in _AGENT_NAMES:
+        return f"Error: Agent '{agent_name}' is not a known agent. {_UNKNOWN_AGENT_SUFFIX}"
 
     agent_url = AGENT_URL_MAP[agent_name]
-    remote_connections = await RemoteConnections.create(
-        timeout=60.0
-    )  # Increased timeout for complex tasks
+    # The shared instance outlives this call, so no close() here.
+    remote_connections = await _get_remote()
 
     try:
         # The task_description is passed directly as the query to the child agent.
@@ -58,8 +137,92 @@ async def delegate_task(agent_name: str, task_description: str) -> str:
 
     except Exception as e:
         return f"Error delegating task to {agent_name}: {str(e)}"
-    finally:
-        await remote_connections.close()
+
+
+# Long-lived background event loop for the sync tool wrappers. One daemon
+# thread and one loop replace the executor-plus-asyncio.run pair the wrappers
+# previously built and tore down on every call; it also keeps the shared
+# RemoteConnections pool on a single loop.
+_bg_loop: Optional[asyncio.AbstractEventLoop] = None
+_bg_loop_lock = threading.Lock()
+
+
+def _get_bg_loop() -> asyncio.AbstractEventLoop:
+    """Return the shared background loop, starting its thread on first use."""
+    global _bg_loop
+    if _bg_loop is None:
+        with _bg_loop_lock:
+            if _bg_loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever, name="delegation-loop", daemon=True
+                )
+                thread.start()
+                _bg_loop = loop
+    return _bg_loop
+
+
+async def delegate_tasks(tasks: List[Dict[str, str]]) -> List[str]:
+    """Delegates several independent tasks to child agents concurrently.
+
+    Each delegation is an independent HTTP round-trip, so fanning them out
+    with asyncio.gather turns N sequential waits into one.
+
+    Args:
+        tasks: A list of {"agent_name": ..., "task_description": ...} dicts.
+
+    Returns:
+        The results from the child agents, in the same order as the input.
+    """
+    # Validate every agent name up front so a typo in one entry surfaces
+    # immediately instead of after the other delegations have run.
+    unknown = [
+        task.get("agent_name", "")
+        for task in tasks
+        if task.get("agent_name", "") not in _AGENT_NAMES
+    ]
+    if unknown:
+        return [f"Error: Unknown agent(s) {unknown}. {_UNKNOWN_AGENT_SUFFIX}"]
+
+    coros = [
+        delegate_task(
+            task.get("agent_name", ""), task.get("task_description", "")
+        )
+        for task in tasks
+    ]
+    # delegate_task catches its own errors, but return_exceptions=True keeps
+    # one unexpected failure from cancelling the sibling delegations.
+    results = await asyncio.gather(*coros, return_exceptions=True)
+    return [
+        f"Error delegating task: {result}"
+        if isinstance(result, BaseException)
+        else result
+        for result in results
+    ]
+
+
+def delegate_tasks_batch(tasks: List[Dict[str, str]]) -> List[str]:
+    """
+    Synchronous wrapper for delegate_tasks to be used as an ADK tool.
+
+    Use this instead of repeated delegate_task_sync calls when the tasks do
+    not depend on each other's results (e.g. two unrelated Notion queries);
+    the delegations run in parallel rather than back-to-back.
+
+    Args:
+        tasks: A list of {"agent_name": ..., "task_description": ...} dicts.
+
+    Returns:
+        The results from the child agents, in the same order as the input,
+        or a single-element error list if the wrapper itself fails.
+    """
+    try:
+        future = asyncio.run_coroutine_threadsafe(
+            delegate_tasks(tasks), _get_bg_loop()
+        )
+        return future.result(timeout=90)  # Generous timeout for orchestrated tasks
+    except Exception as e:
+        return [f"Error in batch delegation wrapper: {str(e)}"]
 
 
 def delegate_task_sync(agent_name: str, task_description: str) -> str:
@@ -78,24 +241,12 @@ def delegate_task_sync(agent_name: str, task_description: str) -> str:
         The result from the child agent, or an error message.
     """
     try:
-        # This pattern handles both scenarios: running within an existing
-        # event loop (like in some web frameworks or notebooks) or running
-        # in a standard synchronous environment.
-        try:
-            asyncio.get_running_loop()
-            # If inside an event loop, run the async code in a separate thread
-            # to avoid "RuntimeError: cannot be called from a running event loop".
-            import concurrent.futures
-
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future = executor.submit(
-                    asyncio.run, delegate_task(agent_name, task_description)
-                )
-                return future.result(
-                    timeout=90
-                )  # Generous timeout for orchestrated tasks
-        except RuntimeError:
-            # No running event loop, so we can safely use asyncio.run()
-            return asyncio.run(delegate_task(agent_name, task_description))
+        # Threadsafe submission works from plain sync code and from inside a
+        # running event loop alike, because the coroutine executes on the
+        # dedicated background loop thread.
+        future = asyncio.run_coroutine_threadsafe(
+            delegate_task(agent_name, task_description), _get_bg_loop()
+        )
+        return future.result(timeout=90)  # Generous timeout for orchestrated tasks
     except Exception as e:
         return f"Error in sync delegation wrapper: {str(e)}"
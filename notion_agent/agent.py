@@ -1,13 +1,35 @@
-import json
-from google.adk.agents.llm_agent import Agent
-from google.adk.tools.mcp_tool.mcp_toolset import MCPToolset, StdioServerParameters
-from google.adk.models.lite_llm import LiteLlm
-from utils.custom_adk_patches import CustomMCPToolset
+"""Notion Agent implementation using ADK and MCPToolset with custom timeout patch."""
 
+import shutil
+from functools import lru_cache
+
+from google.adk.agents.llm_agent import Agent
+from google.adk.tools.mcp_tool.mcp_toolset import StdioServerParameters
 
 from config import NOTION_API_KEY
 from notion_agent.prompt import NOTION_PROMPT
+from utils.custom_adk_patches import CustomMCPToolset
+from utils.fast_json import dumps as json_dumps
 
+# Resolve the npx launcher to an absolute path once at import. This skips the
+# PATH search on every MCP subprocess spawn; if npx is not on PATH we keep the
+# bare name so the stdio client raises its usual, clearer error.
+_NPX_COMMAND = shutil.which("npx") or "npx"
+
+# The MCP headers never change for the lifetime of the process, so the JSON
+# encode happens once at import rather than per factory call (orjson output
+# is already compact, keeping the copied-into-environ string short), and the
+# whole env dict and args tuple are shared by every construction.
+_NOTION_MCP_ENV = {
+    "OPENAPI_MCP_HEADERS": json_dumps({
+        "Authorization": f"Bearer {NOTION_API_KEY}",
+        "Notion-Version": "2022-06-28",
+    })
+}
+_NPX_ARGS = ('-y', '@notionhq/notion-mcp-server')
+
+
+@lru_cache(maxsize=1)
 def create_notion_agent() -> Agent:
     return Agent(
         name="notion_agent_mcp",
@@ -17,15 +39,19 @@ def create_notion_agent() -> Agent:
         tools=[
             CustomMCPToolset(
                 connection_params=StdioServerParameters(
-                    command='npx',
-                    args=['-y', '@notionhq/notion-mcp-server'], 
-                    env={"OPENAPI_MCP_HEADERS": json.dumps({
-                        "Authorization": f"Bearer {NOTION_API_KEY}",
-                        "Notion-Version": "2022-06-28"
-                    })}
+                    command=_NPX_COMMAND,
+                    args=list(_NPX_ARGS),
+                    env=_NOTION_MCP_ENV
                 )
             )
         ]
     )
 
-root_agent = create_notion_agent()
\ No newline at end of file
+
+# Required for ADK discovery. Materialized lazily so that merely importing
+# this module (e.g. from __main__.py, which calls the cached factory itself)
+# does not spawn the Notion MCP subprocess.
+def __getattr__(name: str) -> Agent:
+    if name == "root_agent":
+        return create_notion_agent()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,9 +1,12 @@
 """Notion Agent Executor for A2A integration."""
 
+import asyncio
 import datetime
+import inspect
 import logging
 import uuid
 from collections.abc import AsyncGenerator
+from functools import lru_cache
 
 from a2a.server.agent_execution import AgentExecutor, RequestContext
 from a2a.server.events import EventQueue
@@ -15,30 +18,149 @@ from a2a.types import (
 )
 from a2a.utils import new_agent_text_message
 from google.adk.agents import Agent
+from google.adk.artifacts import InMemoryArtifactService
 from google.adk.events import Event
+from google.adk.memory.in_memory_memory_service import InMemoryMemoryService
 from google.adk.runners import Runner
+from google.adk.sessions import InMemorySessionService
 from google.adk.sessions import Session as ADKSession
 from google.genai import types as adk_types
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+from notion_agent.agent import create_notion_agent
+
+# This is a library module: logging configuration belongs to the entry
+# points (utils.logging_setup.configure()). The NullHandler keeps records
+# from hitting the lastResort stderr handler if the app never configures
+# logging, without locking in a StreamHandler at import time.
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
 
 # Define app name for the runner, specific to this agent
 NOTION_A2A_APP_NAME = "notion_a2a_app"
 
+# Hoisted so cancel() does single attribute loads instead of re-resolving
+# the tzinfo and enum member per cancellation.
+_UTC = datetime.timezone.utc
+_CANCELED_STATE = TaskState.canceled
+
+__all__ = ["NotionADKAgentExecutor", "NOTION_A2A_APP_NAME", "get_shared_runner"]
+
+
+_DRAIN_SENTINEL = object()
+
+
+async def _drain_batched(
+    gen: AsyncGenerator[Event, None], batch_size: int = 16
+) -> AsyncGenerator[list[Event], None]:
+    """Yield events from an async generator in batches.
+
+    Each ``__anext__`` costs a Future allocation and a scheduler bounce; when
+    the ADK runner emits a burst of events, draining whatever is already
+    buffered per turn amortizes that to one bounce per batch. A pump task
+    feeds a queue so no event is lost if the consumer breaks early
+    (cancelling a pending ``__anext__`` on the generator itself could drop
+    one).
+
+    Args:
+        gen: The ADK event stream to drain
+        batch_size: Maximum events handed to the consumer per iteration
+
+    Yields:
+        Non-empty lists of events, in arrival order.
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+
+    async def _pump() -> None:
+        try:
+            async for item in gen:
+                queue.put_nowait(item)
+        finally:
+            queue.put_nowait(_DRAIN_SENTINEL)
+
+    pump = asyncio.ensure_future(_pump())
+    try:
+        while True:
+            item = await queue.get()
+            if item is _DRAIN_SENTINEL:
+                return
+            batch = [item]
+            while len(batch) < batch_size:
+                try:
+                    item = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+                if item is _DRAIN_SENTINEL:
+                    yield batch
+                    return
+                batch.append(item)
+            yield batch
+    finally:
+        pump.cancel()
+        try:
+            # Wait for the pump to unwind so the source generator is no
+            # longer mid-__anext__ when the caller goes on to aclose() it.
+            await pump
+        except (asyncio.CancelledError, Exception):
+            pass
+
+
+def _make_user_content(text: str) -> adk_types.Content:
+    """Build the user-role Content wrapper for a request message.
+
+    model_construct skips pydantic validation, which is safe here: the text
+    is already a str from _prepare_input and the shape is fixed.
+    """
+    return adk_types.Content.model_construct(
+        role="user", parts=[adk_types.Part.model_construct(text=text)]
+    )
+
+
+async def _enqueue(event_queue: EventQueue, event) -> None:
+    """Enqueue an event, awaiting when the queue API is a coroutine.
+
+    a2a-sdk has shipped both sync and async ``enqueue_event`` signatures;
+    awaiting the returned coroutine when there is one keeps events from
+    being silently dropped with a never-awaited RuntimeWarning.
+    """
+    result = event_queue.enqueue_event(event)
+    if inspect.isawaitable(result):
+        await result
+
+
+@lru_cache(maxsize=1)
+def get_shared_runner() -> Runner:
+    """Return the process-wide ADK Runner for the Notion agent.
+
+    A Runner carries the session, artifact and memory stores plus the wired
+    MCP toolset; building one per executor would fragment session state and
+    redo the MCP wiring. The cache keeps construction a one-time cost.
+    """
+    return Runner(
+        app_name=NOTION_A2A_APP_NAME,
+        agent=create_notion_agent(),
+        artifact_service=InMemoryArtifactService(),
+        session_service=InMemorySessionService(),
+        memory_service=InMemoryMemoryService(),
+    )
+
 
 class NotionADKAgentExecutor(AgentExecutor):
     """ADK Agent Executor for Notion A2A integration."""
 
-    def __init__(self, agent: Agent, agent_card: AgentCard, runner: Runner):
-        """Initialize with an Agent instance and provided ADK Runner.
+    def __init__(
+        self, agent: Agent, agent_card: AgentCard, runner: Runner | None = None
+    ):
+        """Initialize with an Agent instance and an optional ADK Runner.
 
         Args:
             agent: The Notion ADK agent instance
             agent_card: Agent card for A2A service registration
-            runner: Pre-configured ADK Runner instance
+            runner: Pre-configured ADK Runner instance; defaults to the
+                shared process-wide runner so every executor reuses one
+                session store and one MCP connection
         """
+        if runner is None:
+            runner = get_shared_runner()
         logger.info(f"Initializing NotionADKAgentExecutor for agent: {agent.name}")
         self.agent = agent
         self._card = agent_card
@@ -48,8 +170,20 @@ class NotionADKAgentExecutor(AgentExecutor):
         self.session_service = runner.session_service
         self.artifact_service = runner.artifact_service
 
+        # Bound once: the hot path reads these on every request for logging
+        # and session APIs, and each read is an attribute-dict lookup.
+        self._agent_name = agent.name
+        self._app_name = runner.app_name
+
+        # Single-flight session setup: known ids skip get_session entirely,
+        # and concurrent requests for the same id (A2A redelivery, retries)
+        # share one in-flight create instead of racing duplicate sessions.
+        self._known_sessions: set[tuple[str, str]] = set()
+        self._session_futures: dict[tuple[str, str], asyncio.Future] = {}
+        self._session_lock = asyncio.Lock()
+
         logger.info(
-            f"ADK Runner accepted for app '{self.runner.app_name}' for agent '{self.agent.name}'"
+            f"ADK Runner accepted for app '{self._app_name}' for agent '{self._agent_name}'"
         )
 
     async def execute(self, context: RequestContext, event_queue: EventQueue) -> None:
@@ -73,109 +207,166 @@ class NotionADKAgentExecutor(AgentExecutor):
             )
 
             # Step 4: Send the response back to the client
-            self._send_response(event_queue, context, final_message_text)
+            await self._send_response(event_queue, context, final_message_text)
 
         except Exception as e:
-            self._handle_error(e, event_queue, context)
+            await self._handle_error(e, event_queue, context)
 
     def _prepare_input(self, context: RequestContext) -> str:
         """Prepare and validate user input."""
         user_input = context.get_user_input()
         if not user_input:
             logger.warning(
-                f"No user input found for {self.agent.name}; using default search."
+                f"No user input found for {self._agent_name}; using default search."
             )
             user_input = "Search for recent pages"
 
-        logger.info(f"{self.agent.name} processing search query: '{user_input}'")
+        logger.info(f"{self._agent_name} processing search query: '{user_input}'")
         return user_input
 
     def _get_session_identifiers(self, context: RequestContext) -> tuple[str, str]:
         """Get user_id and session_id for ADK session management."""
         user_id = "a2a_user_notion"
-        session_id = context.task_id or str(uuid.uuid4())
+        # .hex skips the hyphenated str(UUID) formatting pass.
+        session_id = context.task_id or uuid.uuid4().hex
         return user_id, session_id
 
     async def _ensure_adk_session(self, user_id: str, session_id: str) -> None:
-        """Create or retrieve ADK session."""
-        adk_session: ADKSession | None = await self.session_service.get_session(
-            app_name=self.runner.app_name, user_id=user_id, session_id=session_id
-        )
-        if not adk_session:
-            await self.session_service.create_session(
-                app_name=self.runner.app_name,
-                user_id=user_id,
-                session_id=session_id,
-                state={},
+        """Create or retrieve ADK session (single-flight per id pair)."""
+        key = (user_id, session_id)
+        if key in self._known_sessions:
+            return
+
+        async with self._session_lock:
+            future = self._session_futures.get(key)
+            if future is None:
+                owner = True
+                future = asyncio.get_running_loop().create_future()
+                self._session_futures[key] = future
+            else:
+                owner = False
+
+        if not owner:
+            # Another request is already setting this session up.
+            await future
+            return
+
+        try:
+            adk_session: ADKSession | None = await self.session_service.get_session(
+                app_name=self._app_name, user_id=user_id, session_id=session_id
             )
-            logger.info(f"Created new ADK session: {session_id} for {self.agent.name}")
+            if not adk_session:
+                await self.session_service.create_session(
+                    app_name=self._app_name,
+                    user_id=user_id,
+                    session_id=session_id,
+                    state={},
+                )
+                logger.info(
+                    f"Created new ADK session: {session_id} for {self._agent_name}"
+                )
+            self._known_sessions.add(key)
+            future.set_result(None)
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved in case no concurrent caller awaits the future;
+            # the exception still propagates to our own caller below.
+            future.exception()
+            raise
+        finally:
+            self._session_futures.pop(key, None)
 
     async def _run_agent_and_get_response(
         self, user_input: str, user_id: str, session_id: str
     ) -> str:
         """Run the ADK agent and extract the final response."""
-        request_content = adk_types.Content(
-            role="user", parts=[adk_types.Part(text=user_input)]
-        )
+        request_content = _make_user_content(user_input)
 
-        logger.debug(f"Running ADK agent {self.agent.name} with session {session_id}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Running ADK agent %s with session %s", self._agent_name, session_id
+            )
         events_async: AsyncGenerator[Event, None] = self.runner.run_async(
             user_id=user_id, session_id=session_id, new_message=request_content
         )
 
         final_message_text = "(No search results found)"
+        found_final = False
 
-        async for event in events_async:
-            if (
-                event.is_final_response()
-                and event.content
-                and event.content.role == "model"
-            ):
-                if event.content.parts and event.content.parts[0].text:
-                    final_message_text = event.content.parts[0].text
-                    logger.info(
-                        f"{self.agent.name} final response: '{final_message_text[:200]}{'...' if len(final_message_text) > 200 else ''}'"
-                    )
+        batches = _drain_batched(events_async)
+        try:
+            async for batch in batches:
+                for event in batch:
+                    # Bound once per event: is_final_response() and .content
+                    # were each read up to twice per iteration before.
+                    is_final = event.is_final_response()
+                    if not is_final:
+                        continue
+                    content = event.content
+                    if content and content.role == "model":
+                        parts = content.parts
+                        if parts and parts[0].text:
+                            final_message_text = parts[0].text
+                            # Guarded %-formatting: skip the slice/copy
+                            # entirely when INFO is disabled, and never copy
+                            # more than 200 chars of a multi-KB response.
+                            if logger.isEnabledFor(logging.INFO):
+                                logger.info(
+                                    "%s final response: %r",
+                                    self._agent_name,
+                                    final_message_text[:200],
+                                )
+                            found_final = True
+                            break
+                        else:
+                            logger.warning(
+                                f"{self._agent_name} received final event but no text in first part: {parts}"
+                            )
+                    else:
+                        logger.warning(
+                            f"{self._agent_name} received final event without model content: {event}"
+                        )
+                if found_final:
                     break
-                else:
-                    logger.warning(
-                        f"{self.agent.name} received final event but no text in first part: {event.content.parts}"
-                    )
-            elif event.is_final_response():
-                logger.warning(
-                    f"{self.agent.name} received final event without model content: {event}"
-                )
+        finally:
+            # Deterministic teardown: stop the drain pump, then close the
+            # runner stream so the MCP resources are released promptly
+            # instead of whenever the GC finalizes the generators.
+            await batches.aclose()
+            await events_async.aclose()
 
         return final_message_text
 
-    def _send_response(
+    async def _send_response(
         self, event_queue: EventQueue, context: RequestContext, message_text: str
     ) -> None:
         """Send the response back via the event queue."""
-        logger.info(f"Sending Notion search response for task {context.task_id}")
-        event_queue.enqueue_event(
+        logger.info("Sending Notion search response for task %s", context.task_id)
+        await _enqueue(
+            event_queue,
             new_agent_text_message(
                 text=message_text,
                 context_id=context.context_id,
                 task_id=context.task_id,
-            )
+            ),
         )
 
-    def _handle_error(
+    async def _handle_error(
         self, error: Exception, event_queue: EventQueue, context: RequestContext
     ) -> None:
         """Handle errors and send error response."""
         logger.error(
-            f"Error executing Notion search in {self.agent.name}: {str(error)}",
+            f"Error executing Notion search in {self._agent_name}: {str(error)}",
             exc_info=True,
         )
         error_message_text = f"Error searching Notion workspace: {str(error)}"
-        event_queue.enqueue_event(
+        await _enqueue(
+            event_queue,
             new_agent_text_message(
                 text=error_message_text,
                 context_id=context.context_id,
                 task_id=context.task_id,
-            )
+            ),
         )
 
     async def cancel(self, context: RequestContext, event_queue: EventQueue) -> None:
@@ -188,13 +379,13 @@ class NotionADKAgentExecutor(AgentExecutor):
         task_id = context.task_id or "unknown_task"
         context_id = context.context_id or "unknown_context"
         logger.info(
-            f"Cancelling Notion search task: {task_id} for agent {self.agent.name}"
+            f"Cancelling Notion search task: {task_id} for agent {self._agent_name}"
         )
 
-        timestamp = datetime.datetime.now(datetime.timezone.utc).isoformat()
-        canceled_status = TaskStatus(state=TaskState.canceled, timestamp=timestamp)
+        timestamp = datetime.datetime.now(_UTC).isoformat(timespec="milliseconds")
+        canceled_status = TaskStatus(state=_CANCELED_STATE, timestamp=timestamp)
         cancel_event = TaskStatusUpdateEvent(
             taskId=task_id, contextId=context_id, status=canceled_status, final=True
         )
-        event_queue.enqueue_event(cancel_event)
+        await _enqueue(event_queue, cancel_event)
         logger.info(f"Sent cancel event for Notion task: {task_id}")
@@ -1,8 +1,10 @@
 # notion_agent/test_client.py
 import asyncio
+import operator
 import os
 import traceback
-from typing import Any, Dict
+from itertools import count
+from typing import Any, Callable, Dict
 from uuid import uuid4
 
 import httpx
@@ -11,25 +13,38 @@ from a2a.types import (
     GetTaskRequest,
     GetTaskResponse,
     GetTaskSuccessResponse,
+    Message,
     MessageSendParams,
+    Part,
     SendMessageRequest,
     SendMessageResponse,
     SendMessageSuccessResponse,
     Task,
     TaskQueryParams,
+    TextPart,
 )
 from dotenv import load_dotenv
 
+from utils.fast_json import dumps as _fast_dumps
+
 # Load environment variables from .env
 load_dotenv()
 
 AGENT_URL = os.getenv("NOTION_AGENT_A2A_URL", "http://localhost:8002")
 
+# Poll request IDs only correlate a response with its request on this one
+# connection, so a process-local counter beats a fresh UUID per attempt.
+_poll_request_ids = count(1)
+
 
-def create_send_message_payload(
+def create_send_message_params(
     text: str, task_id: str | None = None, context_id: str | None = None
-) -> Dict[str, Any]:
-    """Create a message payload for A2A communication.
+) -> MessageSendParams:
+    """Create send-message parameters for A2A communication.
+
+    Builds the typed models directly instead of a nested dict that
+    ``MessageSendParams(**payload)`` would re-parse — one validator pass
+    and no throwaway dict per message.
 
     Args:
         text: The message text to send to the agent
@@ -37,20 +52,30 @@ def create_send_message_payload(
         context_id: Optional context ID for conversation context
 
     Returns:
-        Dictionary containing the message payload
+        The prepared send-message parameters
     """
-    payload: Dict[str, Any] = {
-        "message": {
-            "role": "user",
-            "parts": [{"text": text}],
-            "messageId": uuid4().hex,
-        },
-    }
-    if task_id:
-        payload["message"]["taskId"] = task_id
-    if context_id:
-        payload["message"]["contextId"] = context_id
-    return payload
+    return MessageSendParams(
+        message=Message(
+            role="user",
+            parts=[Part(root=TextPart(text=text))],
+            messageId=uuid4().hex,
+            taskId=task_id,
+            contextId=context_id,
+        )
+    )
+
+
+# Serializer candidates, most common shape first. The winning dumper is
+# cached per response class so only the first response of each type pays
+# the probing (each hasattr is a try/except under the hood).
+_JSON_DUMPERS: tuple[Callable[[Any], Any], ...] = (
+    operator.methodcaller("model_dump_json", exclude_none=True),
+    lambda r: r.root.model_dump_json(exclude_none=True),
+    operator.methodcaller("dict", exclude_none=True),
+    _fast_dumps,  # orjson-backed, for plain dict/list payloads
+    str,
+)
+_DUMPER_CACHE: Dict[type, Callable[[Any], Any]] = {}
 
 
 def print_json_response(response: Any, description: str) -> None:
@@ -61,30 +86,42 @@ def print_json_response(response: Any, description: str) -> None:
         description: A description of what this response represents
     """
     print(f"--- {description} ---")
-    try:
-        if hasattr(response, "model_dump_json"):
-            print(response.model_dump_json(exclude_none=True))
-        elif hasattr(response, "root") and hasattr(response.root, "model_dump_json"):
-            print(response.root.model_dump_json(exclude_none=True))
-        elif hasattr(response, "dict"):
-            print(response.dict(exclude_none=True))
-        else:
-            print(str(response))
+    cls = type(response)
+    cached = _DUMPER_CACHE.get(cls)
+    for dumper in (cached,) if cached else _JSON_DUMPERS:
+        try:
+            text = dumper(response)
+        except (AttributeError, TypeError):
+            continue
+        except Exception as e:
+            print(f"Error printing response: {e}")
+            break
+        _DUMPER_CACHE[cls] = dumper
+        print(text)
         print()  # Add a newline after the JSON
-    except Exception as e:
-        print(f"Error printing response: {e}")
-        print(str(response))
-        print()
+        return
+    print(str(response))
+    print()
 
 
-async def _execute_and_poll_task(client: A2AClient, query: str, test_name: str) -> None:
+async def _execute_and_poll_task(
+    client: A2AClient,
+    query: str,
+    test_name: str,
+    semaphore: asyncio.Semaphore | None = None,
+) -> None:
     """Helper function to send a query to the agent and poll for the result."""
+    if semaphore is not None:
+        # Bound concurrent tests so scaling to N of them cannot overwhelm
+        # the agent's single MCP session.
+        async with semaphore:
+            return await _execute_and_poll_task(client, query, test_name)
+
     print(f"\n--- Starting Test: {test_name} ---")
     print(f"Query: {query}")
 
-    send_payload = create_send_message_payload(text=query)
     request = SendMessageRequest(
-        id=str(uuid4()), params=MessageSendParams(**send_payload)
+        id=uuid4().hex, params=create_send_message_params(text=query)
     )
 
     print("\n--- Sending Task ---")
@@ -122,13 +159,19 @@ async def _execute_and_poll_task(client: A2AClient, query: str, test_name: str)
     print(f"Task ID (from agent reply): {task_id}")
     print("\n--- Querying Task Status ---")
 
-    max_retries = 10
-    retry_delay = 2  # seconds
+    # Exponential backoff: the 100ms first probe catches fast tasks instead
+    # of sleeping a flat 2s, while the cap keeps slow tasks from being
+    # hammered. Roughly the same overall budget as the old 10 x 2s loop.
+    max_retries = 15
+    retry_delay = 0.1  # seconds
+    max_delay = 3.0
     task_status = "unknown"
+    # The task ID never changes, so one params object serves every attempt.
+    query_params = TaskQueryParams(id=task_id)
 
     for attempt in range(max_retries):
         get_request = GetTaskRequest(
-            id=str(uuid4()), params=TaskQueryParams(id=task_id)
+            id=f"poll-{next(_poll_request_ids)}", params=query_params
         )
         get_response: GetTaskResponse = await client.get_task(get_request)
         print_json_response(get_response, f"Get Task Response (Attempt {attempt + 1})")
@@ -141,27 +184,22 @@ async def _execute_and_poll_task(client: A2AClient, query: str, test_name: str)
                 if task_status in ["completed", "failed"]:
                     if task_status == "completed" and actual_task_result.artifacts:
                         print("\n--- Final Artifacts ---")
+                        # Artifacts are typed pydantic models; walk their
+                        # fields directly with a single dict fallback
+                        # instead of nested isinstance checks per part.
                         for i, artifact_item in enumerate(actual_task_result.artifacts):
                             if isinstance(artifact_item, dict):
-                                parts_list = artifact_item.get("parts")
-                                if isinstance(parts_list, list):
-                                    for j, part_data in enumerate(parts_list):
-                                        if isinstance(part_data, dict):
-                                            print(f"  Artifact {i}, Part {j}:")
-                                            for key, value in part_data.items():
-                                                print(f"    {key}: {value}")
-                                        else:
-                                            print(
-                                                f"  Artifact {i}, Part {j} (unexpected item type): {part_data}"
-                                            )
-                                else:
-                                    print(
-                                        f"  Artifact {i} (no 'parts' list or not a list): {artifact_item}"
-                                    )
+                                parts_list = artifact_item.get("parts") or ()
                             else:
-                                print(
-                                    f"  Artifact {i} (unexpected type, not a dict): {artifact_item}"
-                                )
+                                parts_list = getattr(artifact_item, "parts", None) or ()
+                            for j, part_data in enumerate(parts_list):
+                                print(f"  Artifact {i}, Part {j}:")
+                                if not isinstance(part_data, dict):
+                                    # Part is a RootModel wrapper.
+                                    root = getattr(part_data, "root", part_data)
+                                    part_data = root.model_dump(exclude_none=True)
+                                for key, value in part_data.items():
+                                    print(f"    {key}: {value}")
                         print("✅ Test complete.")
                     elif task_status == "failed" and actual_task_result.status.message:
                         print(f"❌ Task Failed: {actual_task_result.status.message}")
@@ -174,8 +212,9 @@ async def _execute_and_poll_task(client: A2AClient, query: str, test_name: str)
             )
 
         if attempt < max_retries - 1 and task_status not in ["completed", "failed"]:
-            print(f"Task not final, retrying in {retry_delay}s...")
+            print(f"Task not final, retrying in {retry_delay:.2f}s...")
             await asyncio.sleep(retry_delay)
+            retry_delay = min(max_delay, retry_delay * 1.5)
         elif task_status in ["completed", "failed"]:
             break
         else:
@@ -183,21 +222,27 @@ async def _execute_and_poll_task(client: A2AClient, query: str, test_name: str)
             break
 
 
-async def run_notion_search_test(client: A2AClient) -> None:
+async def run_notion_search_test(
+    client: A2AClient, semaphore: asyncio.Semaphore | None = None
+) -> None:
     """Test the Notion agent's search functionality using the 'sermon notes' use case."""
     await _execute_and_poll_task(
         client,
         "Search my Notion workspace for pages related to 'sermon notes'.",
         "Notion Search Test",
+        semaphore,
     )
 
 
-async def run_notion_database_test(client: A2AClient) -> None:
+async def run_notion_database_test(
+    client: A2AClient, semaphore: asyncio.Semaphore | None = None
+) -> None:
     """Test the Notion agent's database query functionality, specifically counting."""
     await _execute_and_poll_task(
         client,
         "Count the total number of entries in the 'Sermon Notes' database and return only the number.",
         "Notion Database Count Test",
+        semaphore,
     )
 
 
@@ -205,15 +250,25 @@ async def main() -> None:
     """Main function to run Notion agent tests."""
     print(f"Connecting to Notion Agent at {AGENT_URL}...")
     try:
-        async with httpx.AsyncClient(timeout=60.0) as httpx_client:
+        # One pooled client serves every test: HTTP/2 multiplexing when the
+        # server supports it, keep-alive connections either way.
+        async with httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(60.0, connect=5.0),
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+        ) as httpx_client:
             client = await A2AClient.get_client_from_agent_card_url(
                 httpx_client, AGENT_URL
             )
             print("Connection successful.")
 
-            # Run tests sequentially
-            await run_notion_search_test(client)
-            await run_notion_database_test(client)
+            # The tests are independent, so run them concurrently; their
+            # polling sleeps overlap instead of adding up.
+            semaphore = asyncio.Semaphore(4)
+            await asyncio.gather(
+                run_notion_search_test(client, semaphore),
+                run_notion_database_test(client, semaphore),
+            )
 
     except httpx.ConnectError as e:
         print(
@@ -227,4 +282,13 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
+    # uvloop speeds up the socket-heavy polling loop; optional, the stdlib
+    # loop is used when it is not installed. The agent servers already run
+    # on uvloop via uvicorn.
+    try:
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        pass
     asyncio.run(main())
@@ -24,9 +24,12 @@ FEATURES:
 """
 import asyncio
 import os
+import random
+import signal
 import subprocess
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, List, Tuple
 
@@ -80,33 +83,138 @@ def check_env_vars(agents_to_start: List[str]) -> None:
     print("✅ All required environment variables are set.")
 
 
-async def wait_for_service(agent_name: str, url: str, timeout: int = 30) -> bool:
+def _make_probe_client() -> httpx.AsyncClient:
+    """Build the shared keep-alive client used for readiness probes.
+
+    One client serves every probe of every agent, so connection setup is
+    paid once per agent port rather than once per probe. The pool is
+    capped at one connection per agent (three agents plus slack): probes
+    are sequential per agent, so more would sit idle. HTTP/2 would let
+    the probes share even fewer sockets, but uvicorn serves cleartext
+    HTTP/1.1 and the h2 ALPN upgrade needs TLS, so it is not enabled.
+    The transport retries are disabled because the caller does its own
+    retry loop.
+    """
+    return httpx.AsyncClient(
+        timeout=2.0,
+        limits=httpx.Limits(
+            max_connections=4,
+            max_keepalive_connections=4,
+            keepalive_expiry=30.0,
+        ),
+        transport=httpx.AsyncHTTPTransport(retries=0),
+    )
+
+
+async def wait_for_service(
+    client: httpx.AsyncClient, agent_name: str, url: str, timeout: int = 30
+) -> bool:
     """Wait for an agent's A2A service to be ready.
-    
+
     Args:
+        client: Shared keep-alive HTTP client for the probes.
         agent_name: The name of the agent.
         url: The URL of the agent's agent card.
         timeout: The maximum time to wait in seconds.
-        
+
     Returns:
         True if the service becomes ready, False otherwise.
     """
     start_time = time.time()
     print(f"⏳ Waiting for {agent_name} agent to be ready at {url}...")
+    # Exponential backoff with a little jitter: fast-booting agents are
+    # caught by the early sub-100ms probes, slow ones settle at the 2s cap
+    # instead of a fixed 1s cadence. Same overall timeout budget.
+    delay = 0.05
+    attempts = 0
     while time.time() - start_time < timeout:
+        attempts += 1
+        ready = False
         try:
-            async with httpx.AsyncClient(timeout=2.0) as client:
-                response = await client.get(url)
-                if response.status_code == 200:
-                    print(f"✅ {agent_name.title()} agent is ready!")
-                    return True
+            response = await client.get(url)
+            ready = response.status_code == 200
         except (httpx.ConnectError, httpx.TimeoutException):
-            await asyncio.sleep(1)  # Wait before retrying
-    
-    print(f"❌ {agent_name.title()} agent failed to start within {timeout}s.")
+            pass
+        if ready:
+            print(f"✅ {agent_name.title()} agent is ready! ({attempts} probes)")
+            return True
+        # Back off on non-200 responses as well, not only on exceptions.
+        delay = min(2.0, delay * 1.7)
+        await asyncio.sleep(delay * (0.8 + 0.4 * random.random()))
+
+    print(
+        f"❌ {agent_name.title()} agent failed to start within {timeout}s "
+        f"({attempts} probes)."
+    )
     return False
 
 
+def _spawn_agent(agent_name: str, config: Dict[str, Any], logs_dir: Path) -> subprocess.Popen:
+    """Spawn one agent process with its output redirected to log files.
+
+    Args:
+        agent_name: The name of the agent.
+        config: The agent's entry from AGENT_CONFIGS.
+        logs_dir: Directory for the stdout/stderr log files.
+
+    Returns:
+        The started process handle.
+    """
+    cmd = [
+        "python", "-m", config["module"],
+        "--host", config["host"],
+        "--port", str(config["port"])
+    ]
+
+    print(f"🚀 Starting {agent_name} agent with command: {' '.join(cmd)}")
+
+    # Create log files for each agent
+    stdout_log = logs_dir / f"{agent_name}_agent_stdout.log"
+    stderr_log = logs_dir / f"{agent_name}_agent_stderr.log"
+
+    print(f"   📋 Logs: {stdout_log} & {stderr_log}")
+
+    # Use Popen to start the process without blocking, redirect output to
+    # log files. Popen already uses posix_spawn under the hood where the
+    # platform allows, avoiding a full fork of the parent.
+    # start_new_session puts each agent in its own process group: Ctrl+C in
+    # our terminal no longer SIGINTs the agents behind our back, and
+    # shutdown can signal the whole group so grandchildren (e.g. MCP npx
+    # subprocesses) are reached too.
+    # Raw fds instead of Python file objects: the child writes its logs
+    # through the kernel directly, with no TextIOWrapper buffering layer on
+    # our side to flush or garbage-collect. Popen dups the fds, so ours are
+    # closed right after the spawn.
+    stdout_fd = os.open(str(stdout_log), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    stderr_fd = os.open(str(stderr_log), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        return subprocess.Popen(
+            cmd,
+            stdout=stdout_fd,
+            stderr=stderr_fd,
+            start_new_session=True
+        )
+    finally:
+        os.close(stdout_fd)
+        os.close(stderr_fd)
+
+
+def _signal_group(process: subprocess.Popen, sig: int) -> None:
+    """Send a signal to an agent's whole process group.
+
+    The agents are spawned with start_new_session=True, so the group id
+    is the agent's pid; signalling the group reaches any grandchildren
+    the agent spawned. Falls back to signalling the process alone if the
+    group is already gone.
+    """
+    try:
+        os.killpg(os.getpgid(process.pid), sig)
+    except ProcessLookupError:
+        pass
+    except PermissionError:
+        process.send_signal(sig)
+
+
 def ensure_logs_directory() -> Path:
     """Ensure the logs directory exists and return its path.
     
@@ -144,44 +252,50 @@ def main(with_host: bool) -> None:
     processes: Dict[str, subprocess.Popen] = {}
     
     try:
-        # Start all specified agents
-        for agent_name in agents_to_start:
-            config = AGENT_CONFIGS[agent_name]
-            cmd = [
-                "python", "-m", config["module"],
-                "--host", config["host"],
-                "--port", str(config["port"])
-            ]
-            
-            print(f"🚀 Starting {agent_name} agent with command: {' '.join(cmd)}")
-            
-            # Create log files for each agent
-            stdout_log = logs_dir / f"{agent_name}_agent_stdout.log"
-            stderr_log = logs_dir / f"{agent_name}_agent_stderr.log"
-            
-            print(f"   📋 Logs: {stdout_log} & {stderr_log}")
-            
-            # Use Popen to start the process without blocking, redirect output to log files
-            with open(stdout_log, 'w') as stdout_file, open(stderr_log, 'w') as stderr_file:
-                process = subprocess.Popen(
-                    cmd,
-                    stdout=stdout_file,
-                    stderr=stderr_file,
-                    text=True
+        # Start all specified agents in parallel: the fork+exec syscalls
+        # overlap each other, and the readiness probes below then race the
+        # interpreters' warm-up instead of waiting for the last spawn.
+        with ThreadPoolExecutor(max_workers=len(agents_to_start)) as executor:
+            spawns = {
+                agent_name: executor.submit(
+                    _spawn_agent, agent_name, AGENT_CONFIGS[agent_name], logs_dir
                 )
-                processes[agent_name] = process
+                for agent_name in agents_to_start
+            }
+            for agent_name, future in spawns.items():
+                processes[agent_name] = future.result()
 
         # Asynchronously wait for all services to be ready
         async def wait_for_all_services():
-            tasks = []
-            for agent_name in agents_to_start:
-                config = AGENT_CONFIGS[agent_name]
-                url = f"http://{config['host']}:{config['port']}/.well-known/agent.json"
-                tasks.append(wait_for_service(agent_name, url))
-            
-            results = await asyncio.gather(*tasks)
-            if not all(results):
-                raise RuntimeError("One or more agents failed to start. Shutting down.")
+            # One pooled client for every probe of every agent; closed on
+            # the same loop it was used on.
+            async with _make_probe_client() as probe_client:
+                tasks = []
+                for agent_name in agents_to_start:
+                    config = AGENT_CONFIGS[agent_name]
+                    url = f"http://{config['host']}:{config['port']}/.well-known/agent.json"
+                    tasks.append(
+                        asyncio.create_task(
+                            wait_for_service(probe_client, agent_name, url)
+                        )
+                    )
+
+                # Fail fast: react to the first verdict instead of waiting
+                # for every probe loop. One agent hitting its 30s timeout
+                # no longer keeps the others' probes burning alongside it.
+                # The finally also runs when Ctrl+C cancels us mid-await,
+                # so pending probes are torn down before shutdown begins
+                # instead of blocking it.
+                try:
+                    for fut in asyncio.as_completed(tasks):
+                        if not await fut:
+                            raise RuntimeError(
+                                "One or more agents failed to start. Shutting down."
+                            )
+                finally:
+                    for task in tasks:
+                        task.cancel()
+                    await asyncio.gather(*tasks, return_exceptions=True)
 
         asyncio.run(wait_for_all_services())
         
@@ -191,21 +305,36 @@ def main(with_host: bool) -> None:
         while True:
             time.sleep(1)
 
-    except (KeyboardInterrupt, RuntimeError) as e:
-        if isinstance(e, RuntimeError):
-            print(f"\nError: {e}")
+    except KeyboardInterrupt:
+        # Caught separately so Ctrl+C goes straight to the shutdown banner
+        # without the isinstance probe or error formatting.
         print("\n🛑 Shutting down all agents...")
-        
+
+    except RuntimeError as e:
+        print(f"\nError: {e}")
+        print("\n🛑 Shutting down all agents...")
+
     finally:
-        for agent_name, process in processes.items():
-            if process.poll() is None:  # Check if process is still running
-                print(f"   Terminating {agent_name} agent (PID: {process.pid})...")
-                process.terminate()
-                try:
-                    process.wait(timeout=5)
-                except subprocess.TimeoutExpired:
-                    print(f"   {agent_name} agent did not terminate gracefully, killing.")
-                    process.kill()
+        # Signal every agent first, then drain the waits against one shared
+        # deadline: the grace periods overlap, so total shutdown is bounded
+        # by ~5s rather than 5s per agent.
+        running = {
+            agent_name: process
+            for agent_name, process in processes.items()
+            if process.poll() is None
+        }
+        for agent_name, process in running.items():
+            print(f"   Terminating {agent_name} agent (PID: {process.pid})...")
+            _signal_group(process, signal.SIGTERM)
+
+        deadline = time.monotonic() + 5
+        for agent_name, process in running.items():
+            try:
+                process.wait(timeout=max(0, deadline - time.monotonic()))
+            except subprocess.TimeoutExpired:
+                print(f"   {agent_name} agent did not terminate gracefully, killing.")
+                _signal_group(process, signal.SIGKILL)
+                process.wait()
         print("✅ All agent processes terminated.")
 
 
@@ -8,173 +8,256 @@ This is in contrast to ui/app.py which uses the embedded ADK Runner pattern.
 
 import streamlit as st
 import asyncio
+import atexit
 import httpx
+import io
+import operator
 import os
+import threading
 import traceback
 import uuid
+from collections import deque
+from dataclasses import dataclass, field
 from uuid import uuid4
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List
 from dotenv import load_dotenv
 
 from a2a.client import A2AClient
 from a2a.types import (
     GetTaskRequest,
     GetTaskResponse,
-    GetTaskSuccessResponse,
     MessageSendParams,
     SendMessageRequest,
     SendMessageResponse,
-    SendMessageSuccessResponse,
     TaskQueryParams,
 )
 
+from host_agent.remote_connections import create_message_send_params
+from utils.event_loops import new_event_loop
+from utils.fast_json import install_orjson_httpx
+
 # Load environment variables
 load_dotenv()
 
+# Parse A2A JSON-RPC responses with orjson (no-op if it is not installed):
+# one response is decoded per send and per poll attempt of every turn.
+install_orjson_httpx()
+
 # Configuration
 AGENT_URL = os.getenv("HOST_AGENT_A2A_URL", "http://localhost:8001")
-MAX_RETRIES = 15  # Longer timeout for orchestration workflows
-RETRY_DELAY = 3   # Seconds between polling attempts
-TIMEOUT = 90.0    # HTTP timeout for A2A operations
+POLL_BUDGET = 45.0      # Wallclock ceiling for task polling (seconds)
+POLL_DELAY_MIN = 0.25   # First retry delay; grows geometrically
+POLL_DELAY_MAX = 4.0    # Cap so slow tasks are still probed regularly
+TIMEOUT = 90.0          # HTTP timeout for A2A operations
+MAX_AUDIO_FILES = 50    # Sidebar keeps only the most recent audio clips
+MAX_HISTORY = 100       # Transcript messages re-rendered per rerun
+
+# Diagnostic prints are opt-in: each one costs an f-string build plus a
+# stdout flush on the chat critical path, so they only run when the
+# developer exports A2A_DEBUG=1.
+_DEBUG = os.getenv("A2A_DEBUG") == "1"
+
+@dataclass(slots=True)
+class ChatMessage:
+    """One transcript entry; slots keep per-message memory flat.
+
+    The whole transcript is re-rendered on every Streamlit rerun, so the
+    per-message footprint and attribute-access cost are multiplied by the
+    history length each interaction.
+    """
+    role: str
+    content: str
+    tool_calls: List[Dict[str, Any]] = field(default_factory=list)
+    tool_responses: List[Dict[str, Any]] = field(default_factory=list)
+
 
 # --- A2A Client Functions ---
 
+# Unwrapping a JSON-RPC response union (RootModel wrapper -> success
+# response -> result) previously cost a chain of hasattr probes per turn.
+# attrgetter instances are C-level, and the winning one is cached per
+# concrete response class, so after the first response of each type the
+# unwrap is one type() + dict lookup.
+_RESULT_GETTERS: tuple[Callable[[Any], Any], ...] = (
+    operator.attrgetter("root.result"),
+    operator.attrgetter("result"),
+)
+_RESULT_RESOLVER_CACHE: Dict[type, Callable[[Any], Any]] = {}
+
+
+def _resolve_result(response: Any) -> Any:
+    """Return the result payload of a send/get response, or None."""
+    cls = type(response)
+    getter = _RESULT_RESOLVER_CACHE.get(cls)
+    if getter is not None:
+        try:
+            return getter(response)
+        except AttributeError:
+            return None
+    for getter in _RESULT_GETTERS:
+        try:
+            value = getter(response)
+        except AttributeError:
+            continue
+        _RESULT_RESOLVER_CACHE[cls] = getter
+        return value
+    return None
+
+
 def create_send_message_payload(
     text: str, task_id: str | None = None, context_id: str | None = None
-) -> Dict[str, Any]:
-    """Create A2A send message payload with proper format.
-    
+) -> MessageSendParams:
+    """Create A2A send-message parameters with proper format.
+
+    Builds the typed models directly via the host agent's shared helper —
+    one validator pass instead of a nested dict that
+    ``MessageSendParams(**payload)`` would re-parse.
+
     Args:
         text: The message text to send
         task_id: Optional task ID to associate with the message
         context_id: Optional context ID for conversation context
-        
+
+    The caller passes any stored context id explicitly: this runs on the
+    background loop thread, which has no Streamlit script context, so
+    st.session_state must not be read here.
+
     Returns:
-        Dict: Properly formatted A2A message payload
+        MessageSendParams: Properly formatted A2A send parameters
     """
-    # Use stored context ID for conversation continuity if available
-    if context_id is None and 'current_context_id' in st.session_state:
-        context_id = st.session_state.current_context_id
+    if context_id and _DEBUG:
         print(f"🔍 DEBUG: Using stored contextId for continuity: {context_id}")
-    
-    payload: Dict[str, Any] = {
-        'message': {
-            'role': 'user',
-            'parts': [{'text': text}], 
-            'messageId': uuid4().hex,
-        },
-    }
-    if task_id:
-        payload['message']['taskId'] = task_id
-    if context_id:
-        payload['message']['contextId'] = context_id
-    return payload
 
+    return create_message_send_params(text, task_id=task_id, context_id=context_id)
+
+
+async def send_message_to_agent(
+    client: A2AClient, text: str, context_id: str | None = None
+) -> Dict[str, Any]:
+    """Send a message to the agent and describe the outcome.
+
+    Runs on the background loop thread, so it never touches
+    st.session_state or renders anything: everything the script thread
+    needs — the task id, any immediate reply, the context id for
+    continuity, or an error message — travels back in the returned dict.
 
-async def send_message_to_agent(client: A2AClient, text: str, context_id: str | None = None) -> str | None:
-    """Send a message to the agent and return the task ID.
-    
     Args:
         client: The A2A client to use
         text: The message text to send
-        
+        context_id: Stored context id for conversation continuity, if any
+
     Returns:
-        str | None: The task ID if successful, None otherwise
+        Dict with 'task_id', 'immediate_text', 'context_id' and 'error'
+        keys; 'error' is None on success.
     """
+    outcome: Dict[str, Any] = {
+        'task_id': None,
+        'immediate_text': None,
+        'context_id': None,
+        'error': None,
+    }
     try:
-        send_payload = create_send_message_payload(text=text)
-        request = SendMessageRequest(id=str(uuid4()), params=MessageSendParams(**send_payload))
+        send_params = create_send_message_payload(text=text, context_id=context_id)
+        # .hex skips the hyphenated str(UUID) formatting pass.
+        request = SendMessageRequest(id=uuid4().hex, params=send_params)
         
-        print("🔍 DEBUG: Sending request to agent...")
+        if _DEBUG:
+            print("🔍 DEBUG: Sending request to agent...")
         send_response: SendMessageResponse = await client.send_message(request)
-        
-        # Debug logging to console
-        print(f"🔍 DEBUG: Response type: {type(send_response)}")
-        if hasattr(send_response, 'model_dump_json'):
-            print(f"🔍 DEBUG: Response JSON: {send_response.model_dump_json(exclude_none=True)}")
-        
-        # Handle union type wrapper - access the actual response
-        if hasattr(send_response, 'root'):
-            actual_response = send_response.root
-            print(f"🔍 DEBUG: Found root attribute, type: {type(actual_response)}")
-        else:
-            actual_response = send_response
-            print("🔍 DEBUG: No root attribute, using response directly")
-        
-        # Check if we have result attribute on the actual response
-        if not hasattr(actual_response, 'result'):
-            st.error('Response does not have result attribute')
-            return None
 
         # Extract task ID and immediate response from agent's reply
-        agent_reply_data = actual_response.result  # type: ignore
-        print(f"🔍 DEBUG: agent_reply_data type: {type(agent_reply_data)}")
-        
+        agent_reply_data = _resolve_result(send_response)
+        if agent_reply_data is None:
+            outcome['error'] = "Response does not have result attribute"
+            return outcome
+
         # Check for immediate text response in parts (handle safely)
         immediate_text = None
-        if hasattr(agent_reply_data, 'parts'):
-            parts = getattr(agent_reply_data, 'parts', [])
-            if parts:
-                for part in parts:
-                    if hasattr(part, 'root') and hasattr(part.root, 'text'):
-                        immediate_text = getattr(part.root, 'text', None)
-                        if immediate_text:
-                            print(f"🔍 DEBUG: Found immediate text response: {immediate_text[:100]}...")
-                            break
+        for part in getattr(agent_reply_data, 'parts', None) or ():
+            root = getattr(part, 'root', part)
+            immediate_text = getattr(root, 'text', None)
+            if immediate_text:
+                if _DEBUG:
+                    print(f"🔍 DEBUG: Found immediate text response: {immediate_text[:100]}...")
+                outcome['immediate_text'] = immediate_text
+                break
 
         # Extract task ID from the message (matching test_client.py pattern)
         extracted_task_id: str | None = None
 
         # Handle both Pydantic models and dict responses
-        print(f"🔍 DEBUG: Checking for taskId attribute: {hasattr(agent_reply_data, 'taskId')}")
-        if hasattr(agent_reply_data, 'taskId'):
-            task_id_value = getattr(agent_reply_data, 'taskId', None)
-            print(f"🔍 DEBUG: taskId value from attribute: {task_id_value}")
-            if isinstance(task_id_value, str):
-                extracted_task_id = task_id_value
-        
+        task_id_value = getattr(agent_reply_data, 'taskId', None)
+        if isinstance(task_id_value, str):
+            extracted_task_id = task_id_value
+
         if not extracted_task_id and isinstance(agent_reply_data, dict):
             task_id_value = agent_reply_data.get('taskId')
-            print(f"🔍 DEBUG: taskId value from dict: {task_id_value}")
             if isinstance(task_id_value, str):
                 extracted_task_id = task_id_value
 
-        print(f"🔍 DEBUG: Final extracted_task_id: {extracted_task_id}")
+        if _DEBUG:
+            print(f"🔍 DEBUG: Final extracted_task_id: {extracted_task_id}")
 
         if not extracted_task_id:
-            st.error("Could not extract taskId from the agent's reply")
-            return None
+            outcome['error'] = "Could not extract taskId from the agent's reply"
+            return outcome
+        outcome['task_id'] = extracted_task_id
+
+        # Hand the contextId back for the script thread to store.
+        new_context_id = getattr(agent_reply_data, 'contextId', None)
+        if new_context_id:
+            outcome['context_id'] = new_context_id
+            if _DEBUG:
+                print(f"🔍 DEBUG: Returning contextId for continuity: {new_context_id}")
+
+        return outcome
 
-        # Store immediate response if we found one
-        if immediate_text:
-            if 'immediate_responses' not in st.session_state:
-                st.session_state.immediate_responses = {}
-            st.session_state.immediate_responses[extracted_task_id] = immediate_text
-            print(f"🔍 DEBUG: Stored immediate response for task {extracted_task_id}")
-
-        # Store contextId for conversation continuity
-        if hasattr(agent_reply_data, 'contextId'):
-            context_id = getattr(agent_reply_data, 'contextId', None)
-            if context_id:
-                st.session_state.current_context_id = context_id
-                print(f"🔍 DEBUG: Stored contextId for continuity: {context_id}")
-
-        return extracted_task_id
-        
     except Exception as e:
-        st.error(f"Error sending message: {str(e)}")
-        import traceback
-        st.code(traceback.format_exc(), language="python")
+        traceback.print_exc()
+        outcome['error'] = f"Error sending message: {str(e)}"
+        return outcome
+
+
+async def _get_task_raw(client: A2AClient, task_id: str) -> Dict[str, Any] | None:
+    """Poll a task over raw JSON-RPC, skipping response model validation.
+
+    Pydantic validation of GetTaskResponse walks every nested artifact and
+    part just so the poll loop can read status.state; posting the JSON-RPC
+    request through the SDK's own httpx client and reading the decoded dict
+    skips that for the non-terminal polls, which are the common case.
+
+    Returns:
+        The decoded response dict, or None when the SDK internals are not
+        the expected shape (callers then fall back to client.get_task).
+    """
+    httpx_client = getattr(client, 'httpx_client', None)
+    url = getattr(client, 'url', None)
+    if httpx_client is None or not url:
         return None
+    response = await httpx_client.post(
+        url,
+        json={
+            'jsonrpc': '2.0',
+            'id': uuid4().hex,
+            'method': 'tasks/get',
+            'params': {'id': task_id},
+        },
+    )
+    response.raise_for_status()
+    data = response.json()
+    return data if isinstance(data, dict) else None
 
 
-async def poll_for_task_completion(client: A2AClient, task_id: str) -> Dict[str, Any]:
+async def poll_for_task_completion(
+    client: A2AClient, task_id: str, immediate_text: str | None = None
+) -> Dict[str, Any]:
     """Poll for task completion and return structured results.
-    
+
     Args:
         client: The A2A client to use
         task_id: The task ID to poll for
-        
+        immediate_text: Immediate reply returned on the send, if any
+
     Returns:
         Dict: Structured results containing final response, tool calls, etc.
     """
@@ -187,78 +270,115 @@ async def poll_for_task_completion(client: A2AClient, task_id: str) -> Dict[str,
     }
     
 
-    # Check for immediate response first
-    if ('immediate_responses' in st.session_state and 
-        task_id in st.session_state.immediate_responses):
-        immediate_text = st.session_state.immediate_responses[task_id]
-        print(f"🔍 DEBUG: Using immediate response for task {task_id}")
+    # An immediate reply arrives on the send, within this same turn, so the
+    # caller hands it straight in as an argument — no session-state round
+    # trip, which this loop thread could not touch anyway (it has no
+    # Streamlit script context).
+    if immediate_text is not None:
+        if _DEBUG:
+            print(f"🔍 DEBUG: Using immediate response for task {task_id}")
         results['final_response'] = immediate_text
         results['success'] = True
-        # Clean up the immediate response
-        del st.session_state.immediate_responses[task_id]
         return results
     
     try:
         task_status = "unknown"
-        print(f"🔍 DEBUG: No immediate response found, starting polling for task {task_id}")
-        
-        for attempt in range(MAX_RETRIES):
-            get_request = GetTaskRequest(id=str(uuid4()), params=TaskQueryParams(id=task_id))
-            get_response: GetTaskResponse = await client.get_task(get_request)
+        if _DEBUG:
+            print(f"🔍 DEBUG: No immediate response found, starting polling for task {task_id}")
+
+        # Adaptive backoff against a wallclock budget: the 250ms first probe
+        # catches short tasks in one RTT, the growing delay keeps long tasks
+        # from being hammered, and the deadline (rather than a fixed attempt
+        # count) means a task finishing just before the budget is still seen.
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + POLL_BUDGET
+        delay = POLL_DELAY_MIN
+
+        # Non-terminal polls go through the raw JSON-RPC path (plain dict
+        # access, no model validation); if the SDK internals ever stop
+        # matching, the loop falls back to the typed client.get_task.
+        use_raw_poll = True
+
+        while True:
+            task_result: Any = None
+            task_status = "unknown"
+
+            if use_raw_poll:
+                try:
+                    data = await _get_task_raw(client, task_id)
+                except Exception:
+                    data = None
+                if data is None:
+                    use_raw_poll = False
+                else:
+                    task_result = data.get('result')
+            if not use_raw_poll:
+                get_request = GetTaskRequest(id=uuid4().hex, params=TaskQueryParams(id=task_id))
+                get_response: GetTaskResponse = await client.get_task(get_request)
+                task_result = _resolve_result(get_response)
+
+            # Normalize status access across raw dicts and typed models.
+            status: Any = None
+            if isinstance(task_result, dict):
+                status = task_result.get('status') or {}
+                task_status = status.get('state', "unknown")
+            elif task_result is not None:
+                status = getattr(task_result, 'status', None)
+                if status is not None:
+                    # TaskState is a plain Enum in a2a-sdk 0.2.5; unwrap to
+                    # its value so the terminal checks below compare like
+                    # with like on both the raw-dict and typed paths.
+                    task_status = getattr(status.state, 'value', status.state)
+
+            if task_status in ["completed", "failed"]:
+                if task_status == "completed":
+                    if isinstance(task_result, dict):
+                        artifacts = task_result.get('artifacts')
+                    else:
+                        artifacts = getattr(task_result, 'artifacts', None)
+
+                    # Assemble the response text in one growable buffer
+                    # rather than a part list plus a final join copy.
+                    buf = io.StringIO()
+
+                    for artifact_item in artifacts or ():
+                        if isinstance(artifact_item, dict):
+                            parts_list = artifact_item.get('parts')
+                            if isinstance(parts_list, list):
+                                for part_data in parts_list:
+                                    if isinstance(part_data, dict):
+                                        text = part_data.get('text')
+                                        audio_url = part_data.get('audio_url')
+
+                                        if text:
+                                            if buf.tell():
+                                                buf.write('\n')
+                                            buf.write(text)
+                                        if audio_url and not results['audio_url']:
+                                            results['audio_url'] = audio_url
+
+                    results['final_response'] = buf.getvalue() or "Task completed successfully."
+                    results['success'] = True
 
-            # Handle union type wrapper for get_response
-            if hasattr(get_response, 'root'):
-                actual_get_response = get_response.root
-            else:
-                actual_get_response = get_response
-                
-            if hasattr(actual_get_response, 'result'):
-                actual_task_result = getattr(actual_get_response, 'result', None)
-                if not actual_task_result:
-                    continue
-            else:
-                continue
-                
-            if actual_task_result and hasattr(actual_task_result, 'status'):
-                task_status = actual_task_result.status.state
-                
-                if task_status in ["completed", "failed"]:
-                    if task_status == "completed" and hasattr(actual_task_result, 'artifacts') and actual_task_result.artifacts:
-                        # Process artifacts to extract results
-                        final_text_parts = []
-                        
-                        for artifact_item in actual_task_result.artifacts:
-                            if isinstance(artifact_item, dict):
-                                parts_list = artifact_item.get('parts')
-                                if isinstance(parts_list, list):
-                                    for part_data in parts_list:
-                                        if isinstance(part_data, dict):
-                                            text = part_data.get('text')
-                                            audio_url = part_data.get('audio_url')
-                                            
-                                            if text:
-                                                final_text_parts.append(text)
-                                            if audio_url and not results['audio_url']:
-                                                results['audio_url'] = audio_url
-                        
-                        results['final_response'] = '\n'.join(final_text_parts) if final_text_parts else "Task completed successfully."
-                        results['success'] = True
-                        
-                    elif task_status == "failed":
-                        error_msg = actual_task_result.status.message if hasattr(actual_task_result.status, 'message') and actual_task_result.status.message else "Task failed"
-                        results['final_response'] = f"❌ Task Failed: {error_msg}"
-                        results['success'] = False
-                    
-                    return results
+                else:
+                    if isinstance(status, dict):
+                        error_msg = status.get('message') or "Task failed"
+                    else:
+                        error_msg = getattr(status, 'message', None) or "Task failed"
+                    results['final_response'] = f"❌ Task Failed: {error_msg}"
+                    results['success'] = False
+
+                return results
             
-            # If not completed, wait and retry
-            if attempt < MAX_RETRIES - 1 and task_status not in ["completed", "failed"]:
-                await asyncio.sleep(RETRY_DELAY)
-            elif task_status in ["completed", "failed"]:
+            # Not terminal yet: back off, but never sleep past the deadline.
+            remaining = deadline - loop.time()
+            if remaining <= 0:
                 break
-        
-        # If we get here, max retries reached
-        results['final_response'] = f"⏰ Timeout: Task did not complete after {MAX_RETRIES} attempts"
+            await asyncio.sleep(min(delay, remaining))
+            delay = min(POLL_DELAY_MAX, delay * 1.6)
+
+        # If we get here, the polling budget is exhausted
+        results['final_response'] = f"⏰ Timeout: Task did not complete within {POLL_BUDGET:.0f}s"
         results['success'] = False
         return results
         
@@ -269,107 +389,155 @@ async def poll_for_task_completion(client: A2AClient, task_id: str) -> Dict[str,
 
 
 @st.cache_resource
-def get_a2a_client() -> None:
-    """Initialize A2A client connection placeholder.
-    
-    Note: Due to async requirements, actual client creation happens in run_agent_logic_a2a.
-    This function serves as a placeholder for Streamlit's caching mechanism.
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    """Return the long-lived event loop shared by every chat turn.
+
+    Streamlit reruns the script per interaction; a loop cached in
+    st.cache_resource survives those reruns, so the A2A client (and its
+    keep-alive connections) stay bound to one loop instead of being torn
+    down by a fresh asyncio.run each turn. Built through
+    utils.event_loops so uvloop is used when installed.
     """
-    print("🔧 A2A Client placeholder initialized (actual client created per request)")
-    return None
+    loop = new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, name="a2a-ui-loop", daemon=True)
+    thread.start()
+    return loop
 
 
-async def create_a2a_client() -> A2AClient | None:
-    """Create A2A client connection asynchronously.
-    
+async def _create_a2a_client() -> A2AClient:
+    """Build the pooled HTTP client and resolve the agent card once."""
+    httpx_client = httpx.AsyncClient(
+        timeout=TIMEOUT,
+        limits=httpx.Limits(max_keepalive_connections=4, keepalive_expiry=60.0),
+    )
+
+    loop = asyncio.get_running_loop()
+
+    def _close_pool() -> None:
+        # Best-effort shutdown of the keep-alive pool at interpreter exit.
+        try:
+            asyncio.run_coroutine_threadsafe(httpx_client.aclose(), loop).result(5)
+        except Exception:
+            pass
+
+    atexit.register(_close_pool)
+    return await A2AClient.get_client_from_agent_card_url(httpx_client, AGENT_URL)
+
+
+@st.cache_resource
+def get_a2a_client() -> A2AClient | None:
+    """Create (once) and return the shared A2A client.
+
+    The agent-card fetch and TCP handshake happen only on the first turn;
+    later turns reuse the cached client and its keep-alive pool.
+
     Returns:
         A2AClient | None: The A2A client or None if connection failed
     """
     try:
-        print(f"🔍 DEBUG: Connecting to agent at {AGENT_URL}")
-        httpx_client = httpx.AsyncClient(timeout=TIMEOUT)
-        client = await A2AClient.get_client_from_agent_card_url(httpx_client, AGENT_URL)
-        print("🔍 DEBUG: A2A client created successfully")
+        if _DEBUG:
+            print(f"🔍 DEBUG: Connecting to agent at {AGENT_URL}")
+        future = asyncio.run_coroutine_threadsafe(
+            _create_a2a_client(), get_event_loop()
+        )
+        client = future.result(timeout=TIMEOUT)
+        if _DEBUG:
+            print("🔍 DEBUG: A2A client created successfully")
         return client
     except httpx.ConnectError as e:
         st.error(f"❌ Connection error: Could not connect to agent at {AGENT_URL}. Ensure the server is running.")
         st.info("To start the host agent server: `python -m host_agent --port 8001`")
         st.code(str(e), language="python")
+        get_a2a_client.clear()  # Retry the connection on the next rerun
         return None
     except Exception as e:
         st.error(f"❌ An unexpected error occurred: {e}")
         import traceback
         st.code(traceback.format_exc(), language="python")
+        get_a2a_client.clear()
         return None
 
 
 # --- Agent Logic ---
 
-async def run_agent_logic_a2a(prompt: str) -> Dict[str, Any]:
+async def run_agent_logic_a2a(
+    client: A2AClient, prompt: str, context_id: str | None = None
+) -> Dict[str, Any]:
     """
     Send a message to the Host Agent via A2A and poll for results.
-    
+
+    Runs entirely on the background loop thread, which has no Streamlit
+    script context: st.session_state there resolves to a process-global
+    mock and st.* display calls are silent no-ops. So the script thread
+    resolves the client and reads the stored context id before
+    scheduling, passes both in, and picks the refreshed context id back
+    out of the result dict.
+
     Args:
+        client: The cached A2A client (resolved on the script thread)
         prompt: User's input message
-        
+        context_id: Stored context id for conversation continuity, if any
+
     Returns:
-        Dictionary containing final response, tool calls, and any artifacts (like audio URLs)
+        Dictionary containing final response, tool calls, any artifacts
+        (like audio URLs) and the context id to store for the next turn
     """
+    results: Dict[str, Any] = {
+        'final_response': '',
+        'tool_calls': [],
+        'tool_responses': [],
+        'audio_url': None,
+        'success': False,
+        'context_id': context_id,
+    }
     try:
-        # Create A2A client
-        client = await create_a2a_client()
-        if not client:
-            return {
-                'final_response': "❌ Failed to connect to Host Agent service",
-                'tool_calls': [],
-                'tool_responses': [],
-                'audio_url': None,
-                'success': False
-            }
-        
         # Step 1: Send message and get task ID
-        print("🔍 DEBUG: Step 1 - Sending message to agent")
-        task_id = await send_message_to_agent(client, prompt)
-        if not task_id:
-            print("🔍 DEBUG: Failed to get task ID from agent")
-            return {
-                'final_response': "❌ Failed to send message to agent",
-                'tool_calls': [],
-                'tool_responses': [],
-                'audio_url': None,
-                'success': False
-            }
-        
-        st.info(f"📤 Task submitted with ID: {task_id}")
-        print(f"🔍 DEBUG: Got task ID: {task_id}")
-        
-        # Step 2: Poll for completion
-        print("🔍 DEBUG: Step 2 - Starting polling")
-        with st.spinner("🔄 Polling for task completion..."):
-            results = await poll_for_task_completion(client, task_id)
-        
+        if _DEBUG:
+            print("🔍 DEBUG: Step 1 - Sending message to agent")
+        sent = await send_message_to_agent(client, prompt, context_id)
+        if sent['context_id']:
+            results['context_id'] = sent['context_id']
+        if sent['error'] or not sent['task_id']:
+            if _DEBUG:
+                print("🔍 DEBUG: Failed to get task ID from agent")
+            results['final_response'] = (
+                f"❌ {sent['error'] or 'Failed to send message to agent'}"
+            )
+            return results
+
+        if _DEBUG:
+            print(f"🔍 DEBUG: Got task ID: {sent['task_id']}")
+
+        # Step 2: Poll for completion (or use the immediate reply)
+        if _DEBUG:
+            print("🔍 DEBUG: Step 2 - Starting polling")
+        results.update(
+            await poll_for_task_completion(
+                client, sent['task_id'], sent['immediate_text']
+            )
+        )
         return results
-        
+
     except Exception as e:
-        st.error(f"Error in A2A communication: {str(e)}")
         traceback.print_exc()
-        return {
-            'final_response': f"An error occurred: {str(e)}",
-            'tool_calls': [],
-            'tool_responses': [],
-            'audio_url': None,
-            'success': False
-        }
+        results['final_response'] = f"An error occurred: {str(e)}"
+        return results
 
 
 def initialize_session_state():
     """Initialize Streamlit session state variables."""
     if 'session_id' not in st.session_state:
-        st.session_state.session_id = f"a2a-session-{uuid.uuid4()}"
+        st.session_state.session_id = f"a2a-session-{uuid.uuid4().hex}"
     if 'conversation_history' not in st.session_state:
-        st.session_state.conversation_history = []
+        # Bounded: every rerun replays the full transcript, so the deque
+        # caps that cost at MAX_HISTORY messages.
+        st.session_state.conversation_history = deque(maxlen=MAX_HISTORY)
     if 'audio_files' not in st.session_state:
         st.session_state.audio_files = []
+    if 'audio_files_seen' not in st.session_state:
+        # Set mirror of audio_files for O(1) dedup; the list keeps the
+        # insertion order the sidebar renders.
+        st.session_state.audio_files_seen = set()
     if 'current_context_id' not in st.session_state:
         st.session_state.current_context_id = None
 
@@ -402,7 +570,7 @@ def main():
         layout="wide"
     )
     
-    # Initialize the cached A2A client
+    # Warm the cached A2A client (agent-card fetch happens once here)
     get_a2a_client()
     
     # Initialize session state for UI elements
@@ -446,22 +614,21 @@ def main():
     
     # Display conversation history
     for message in st.session_state.conversation_history:
-        with st.chat_message(message["role"]):
-            st.write(message["content"])
-            
+        with st.chat_message(message.role):
+            st.write(message.content)
+
             # Show tool interactions if present
-            if "tool_calls" in message:
-                display_tool_calls(message["tool_calls"])
-            if "tool_responses" in message:
-                display_tool_responses(message["tool_responses"])
+            if message.tool_calls:
+                display_tool_calls(message.tool_calls)
+            if message.tool_responses:
+                display_tool_responses(message.tool_responses)
     
     # Chat input
     if prompt := st.chat_input("Ask me to search Notion or create audio..."):
         # Add user message to history
-        st.session_state.conversation_history.append({
-            "role": "user",
-            "content": prompt
-        })
+        st.session_state.conversation_history.append(
+            ChatMessage(role="user", content=prompt)
+        )
         
         # Display user message
         with st.chat_message("user"):
@@ -469,10 +636,39 @@ def main():
         
         # Process with agent via A2A
         with st.chat_message("assistant"):
-            with st.spinner("🤔 Agent is processing your request via A2A..."):
-                # Use asyncio.run to bridge sync UI to async A2A logic
-                result = asyncio.run(run_agent_logic_a2a(prompt))
-            
+            # Resolve the cached client here on the script thread, where
+            # its st.error/st.info reporting actually renders.
+            client = get_a2a_client()
+            if client is None:
+                result = {
+                    'final_response': "❌ Failed to connect to Host Agent service",
+                    'tool_calls': [],
+                    'tool_responses': [],
+                    'audio_url': None,
+                    'success': False,
+                    'context_id': None,
+                }
+            else:
+                with st.spinner("🤔 Agent is processing your request via A2A..."):
+                    # Schedule onto the persistent loop so the cached
+                    # client's connections stay valid across turns
+                    # (asyncio.run would tear the loop down each time). The
+                    # loop thread has no Streamlit script context, so the
+                    # stored context id is read here and passed in rather
+                    # than read from st.session_state over there. The
+                    # timeout bounds a hung turn so it cannot wedge the
+                    # Streamlit script thread.
+                    result = asyncio.run_coroutine_threadsafe(
+                        run_agent_logic_a2a(
+                            client, prompt, st.session_state.current_context_id
+                        ),
+                        get_event_loop(),
+                    ).result(timeout=TIMEOUT + POLL_BUDGET)
+
+            # Store the refreshed context id for the next turn's continuity
+            if result.get('context_id'):
+                st.session_state.current_context_id = result['context_id']
+
             # Display final response
             if result['final_response']:
                 st.write(result['final_response'])
@@ -484,18 +680,24 @@ def main():
             # Handle audio if present
             if result['audio_url']:
                 st.audio(result['audio_url'], format="audio/mp3")
-                # Add to session audio files
-                if result['audio_url'] not in st.session_state.audio_files:
+                # Add to session audio files (set membership, not a list scan)
+                if result['audio_url'] not in st.session_state.audio_files_seen:
+                    st.session_state.audio_files_seen.add(result['audio_url'])
                     st.session_state.audio_files.append(result['audio_url'])
+                    # Bound the sidebar: only the most recent clips stay.
+                    if len(st.session_state.audio_files) > MAX_AUDIO_FILES:
+                        dropped = st.session_state.audio_files.pop(0)
+                        st.session_state.audio_files_seen.discard(dropped)
             
             # Add assistant message to history
-            assistant_message = {
-                "role": "assistant",
-                "content": result['final_response'],
-                "tool_calls": result['tool_calls'],
-                "tool_responses": result['tool_responses']
-            }
-            st.session_state.conversation_history.append(assistant_message)
+            st.session_state.conversation_history.append(
+                ChatMessage(
+                    role="assistant",
+                    content=result['final_response'],
+                    tool_calls=result['tool_calls'],
+                    tool_responses=result['tool_responses'],
+                )
+            )
 
 
 if __name__ == "__main__":
@@ -13,45 +13,163 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 
 import streamlit as st
 import asyncio
-from typing import Any, Dict, List
-from google.adk.sessions import InMemorySessionService
-from google.adk.runners import Runner
-from google.adk.events import Event
-from google.genai import types
+import concurrent.futures
+import httpx
+import io
+import threading
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Any, Dict, List
 import traceback
 import uuid
 
-# Import the host agent creation logic
-from host_agent.agent import create_host_agent
+from ui.history import create_history_store
+from utils.event_loops import new_event_loop
+from utils.fast_json import dumps as _json_dumps
+
+if TYPE_CHECKING:
+    from google.adk.runners import Runner
+
+# The ADK/google.genai/host_agent import chain costs hundreds of ms; it is
+# deliberately absent from module scope so `streamlit run` paints the page
+# chrome before it resolves. The warmup thread below pulls the whole chain
+# (and builds the agent graph) in the background instead.
+
+
+def _warm_host_agent() -> None:
+    """Import the agent stack and build the graph, off the main thread.
+
+    Building the graph resolves the LiteLlm model wrapper and tool
+    wiring, which otherwise serializes the first user turn behind the
+    first UI paint. create_host_agent is lru_cached, so the runner
+    factory below gets the same instance.
+    """
+    from host_agent.agent import create_host_agent
+
+    create_host_agent()
+
+
+_host_agent_warmup = threading.Thread(
+    target=_warm_host_agent, name="host-agent-warmup", daemon=True
+)
+_host_agent_warmup.start()
 
 # App configuration
 APP_NAME = "host_agent_ui"
 USER_ID = "streamlit_user"
+MAX_AUDIO_FILES = 20   # Sidebar keeps only the most recent audio clips
+VISIBLE_MESSAGES = 30  # Transcript messages rendered per rerun by default
+
+# Streamed text is flushed to the placeholder in chunks: each markdown
+# update costs a widget diff plus a websocket frame, so per-token updates
+# saturate CPU at high token rates. Flush by size or age, whichever
+# trips first (the age cap keeps the UI at roughly 20Hz).
+CHUNK_MAX_BYTES = 512
+CHUNK_MAX_AGE = 0.05  # seconds
+
+# Worst-case wallclock per chat turn: a hung MCP tool used to pin the
+# spinner forever.
+PER_TURN_TIMEOUT = 120.0
 
 # --- Service and Runner Initialization ---
 
-@st.cache_resource
-def get_adk_runner() -> Runner:
-    """
-    Initializes and caches the ADK Runner using Streamlit's resource caching.
-    
-    This function is decorated with @st.cache_resource, which ensures that:
-    - A single, persistent Runner instance is created per user session
-    - The Runner maintains the agent's context and memory across Streamlit reruns
-    - The function is only executed once per session, not on every interaction
-    
+@st.cache_resource(max_entries=64)
+def get_adk_runner(session_id: str) -> "Runner":
+    """Build and cache one ADK Runner per browser session.
+
+    st.cache_resource is process-global, not per-session, so an unkeyed
+    runner would hand every user the same session_service and let its
+    in-memory session blobs grow without bound. Keying by session_id
+    isolates each browser session behind its own runner, and max_entries
+    evicts the least recently used runner (and its sessions) as users
+    churn. The agent graph itself is lru_cached in create_host_agent, so
+    the per-session cost is only the Runner and service shells.
+
+    Args:
+        session_id: The browser session's id, used as the cache key.
+
     Returns:
-        Runner: The cached ADK Runner instance with persistent session state
+        Runner: The cached ADK Runner instance for this session.
     """
-    print("🔧 Creating new ADK Runner instance (this should only appear once per session)")
-    
-    session_service = InMemorySessionService()
+    print(f"🔧 Creating new ADK Runner instance for session {session_id}")
+
+    # Deferred imports: the warmup thread normally has these modules in
+    # sys.modules already, making this a dict lookup, not real import work.
+    from google.adk.runners import Runner
+    from host_agent.agent import create_host_agent
+    from host_agent.tools import prewarm_connections
+    from ui.session_service import create_session_service
+
+    # Redis-backed when ADK_SESSION_REDIS_URL is set (multi-replica
+    # deployments), in-memory otherwise.
+    session_service = create_session_service()
+    # Join the import-time warmup; by the time a first prompt arrives the
+    # graph is normally already built and this returns from the lru_cache.
+    _host_agent_warmup.join()
     host_agent = create_host_agent()
-    return Runner(
+    runner = Runner(
         agent=host_agent,
         app_name=APP_NAME,
         session_service=session_service,
     )
+    # Create this session's ADK session now, on the script thread: the
+    # cache key already scopes this code to run once per session id, so
+    # no session_state flag is needed (a flag checked on the background
+    # loop thread would hit the process-global mock state and fire only
+    # for the first browser session). get_session first so a runner
+    # rebuilt after LRU eviction does not overwrite a session that a
+    # persistent backend (Redis) still holds.
+    async def _ensure_session() -> None:
+        existing = await session_service.get_session(
+            app_name=APP_NAME, user_id=USER_ID, session_id=session_id
+        )
+        if existing is None:
+            await session_service.create_session(
+                app_name=APP_NAME, user_id=USER_ID, session_id=session_id
+            )
+            print(f"✅ ADK session created: {session_id}")
+
+    asyncio.run_coroutine_threadsafe(_ensure_session(), get_loop()).result(timeout=30)
+
+    # Warm downstream A2A connections in the background: resolving each
+    # child agent's card now means the first delegation skips DNS, TCP
+    # and the card fetch. Fire-and-forget on the turn loop, where the
+    # pool will actually be used; failures retry on first real use.
+    asyncio.run_coroutine_threadsafe(prewarm_connections(), get_loop())
+    return runner
+
+@st.cache_resource
+def get_history_store():
+    """Return the shared conversation-history backend.
+
+    Redis-backed when UI_HISTORY_REDIS_URL is set, in-process otherwise;
+    either way the history no longer rides in st.session_state, so reruns
+    stop re-serializing the whole transcript with the session.
+    """
+    return create_history_store()
+
+
+@st.cache_data(max_entries=32, ttl=3600, show_spinner=False)
+def fetch_audio(url: str) -> bytes:
+    """Download an audio clip once and cache the bytes by URL.
+
+    Passing bytes to st.audio lets Streamlit serve replays from its own
+    static cache instead of the browser re-requesting the ElevenLabs URL
+    on every rerun. Clips are immutable and URL-addressed, so the global
+    data cache is safe here.
+    """
+    response = httpx.get(url, timeout=10.0, follow_redirects=True)
+    response.raise_for_status()
+    return response.content
+
+
+def _audio_source(url: str):
+    """Return cached clip bytes, falling back to the URL on fetch failure."""
+    try:
+        return fetch_audio(url)
+    except Exception:
+        return url
+
 
 @st.cache_resource
 def initialize_adk_session():
@@ -71,110 +189,251 @@ def initialize_adk_session():
 
 # --- Agent Logic ---
 
-async def run_agent_logic(prompt: str, session_id: str) -> Dict[str, Any]:
+def _get(obj: Any, key: str) -> Any:
+    """Fetch ``key`` from a dict or, failing that, an attribute.
+
+    Tool responses usually arrive as plain dicts, but typed ADK payloads
+    surface the same fields as attributes; one accessor covers both
+    without an isinstance ladder per event.
     """
-    Instantiates and runs the Host Agent, returning structured results.
-    
+    if obj is None:
+        return None
+    try:
+        return obj.get(key)
+    except AttributeError:
+        return getattr(obj, key, None)
+
+
+def _extract_audio(response_data: Any) -> Any:
+    """Pull an audio_url out of a tool-response payload, if present.
+
+    ElevenLabs responses carry the URL either at the top level or nested
+    one level under "response"; this single accessor replaces the old
+    isinstance/membership ladder that ran per function_response event.
+    """
+    return _get(response_data, 'audio_url') or _get(
+        _get(response_data, 'response'), 'audio_url'
+    )
+
+
+async def run_agent_events(runner: "Runner", prompt: str, session_id: str):
+    """Run the Host Agent and yield UI events as they arrive.
+
+    Instead of collecting the whole response before the UI draws anything,
+    this async generator yields ``("chunk", text)``, ``("tool_call", dict)``
+    and ``("tool_response", dict)`` tuples as the runner emits them, ending
+    with ``("final", results_dict)`` carrying the same structured record
+    the old blocking call returned. Text is coalesced into chunks of up
+    to CHUNK_MAX_BYTES or CHUNK_MAX_AGE seconds so the caller repaints at
+    a bounded rate; perceived latency is still first-chunk time rather
+    than full-completion time.
+
+    Runs on the background loop thread, which has no Streamlit script
+    context, so it takes the runner as an argument (resolved by the
+    caller on the script thread, where get_adk_runner also ensures the
+    ADK session exists) and never touches st.session_state or st.*.
+
     Args:
+        runner: This session's cached Runner, with its session created
         prompt: User's input message
-        
-    Returns:
-        Dictionary containing final response, tool calls, and any artifacts (like audio URLs)
+        session_id: The per-user ADK session id
+
+    Yields:
+        (kind, payload) tuples as described above.
     """
+    # Deferred like the runner imports; a sys.modules hit after the first turn.
+    from google.genai import types
+
     try:
-        # Retrieve the persistent runner instance from the cache.
-        runner = get_adk_runner()
-        
-        # Ensure ADK session exists ONCE per streamlit session
-        if 'adk_session_initialized' not in st.session_state:
-            try:
-                await runner.session_service.create_session(
-                    app_name=APP_NAME,
-                    user_id=USER_ID,
-                    session_id=session_id
-                )
-                print(f"✅ ADK session created: {session_id}")
-                st.session_state.adk_session_initialized = True
-            except Exception:
-                # Session might already exist in a rare case, but we can proceed.
-                st.session_state.adk_session_initialized = True
-        
         # Track results
         tool_calls = []
         tool_responses = []
         final_response = ""
         audio_url = None
-        
+
+        # Pending text awaiting a size- or age-triggered flush; a StringIO
+        # grows in place instead of re-joining a fresh list per flush.
+        text_buf = io.StringIO()
+        last_flush = time.monotonic()
+
         # Execute the runner and process events (using the dynamic session_id)
         async for event in runner.run_async(
             user_id=USER_ID,
             session_id=session_id,  # Use dynamic session ID for user isolation
             new_message=types.Content(role="user", parts=[types.Part(text=prompt)]),
         ):
+            is_final = event.is_final_response()
             if event.content and event.content.parts:
                 for part in event.content.parts:
                     # Handle function calls (tool calls)
                     if part.function_call:
-                        tool_calls.append({
+                        # Flush buffered text first so render order holds.
+                        if text_buf.tell():
+                            yield ("chunk", text_buf.getvalue())
+                            text_buf.seek(0)
+                            text_buf.truncate()
+                            last_flush = time.monotonic()
+                        call = {
                             'name': part.function_call.name,
                             'args': part.function_call.args
-                        })
-                    
+                        }
+                        tool_calls.append(call)
+                        yield ("tool_call", call)
+
                     # Handle function responses (tool responses)
                     elif part.function_response:
+                        if text_buf.tell():
+                            yield ("chunk", text_buf.getvalue())
+                            text_buf.seek(0)
+                            text_buf.truncate()
+                            last_flush = time.monotonic()
                         response_data = part.function_response.response
-                        tool_responses.append({
+                        response = {
                             'name': part.function_response.name,
                             'response': response_data
-                        })
-                        
+                        }
+                        tool_responses.append(response)
+                        yield ("tool_response", response)
+
                         # Check for audio URL in ElevenLabs responses
-                        if (isinstance(response_data, dict) and 
-                            'response' in response_data and 
-                            isinstance(response_data['response'], dict)):
-                            inner_response = response_data['response']
-                            if 'audio_url' in inner_response:
-                                audio_url = inner_response['audio_url']
-                        elif isinstance(response_data, dict) and 'audio_url' in response_data:
-                            audio_url = response_data['audio_url']
-            
+                        found_audio = _extract_audio(response_data)
+                        if found_audio is not None:
+                            audio_url = found_audio
+
+                    # Buffer text and flush by size or age, including the
+                    # final message's parts — the final dict still carries
+                    # the complete text for the transcript.
+                    elif part.text:
+                        text_buf.write(part.text)
+                        now = time.monotonic()
+                        if text_buf.tell() >= CHUNK_MAX_BYTES or now - last_flush >= CHUNK_MAX_AGE:
+                            yield ("chunk", text_buf.getvalue())
+                            text_buf.seek(0)
+                            text_buf.truncate()
+                            last_flush = now
+
             # Handle final response
-            if event.is_final_response():
+            if is_final:
                 if event.content and event.content.parts:
                     final_response = "".join([p.text for p in event.content.parts if p.text])
                 elif event.actions and event.actions.escalate:
                     final_response = f"Agent escalated: {event.error_message or 'No specific message.'}"
                 break
-        
-        return {
+
+        if text_buf.tell():
+            yield ("chunk", text_buf.getvalue())
+
+        yield ("final", {
             'final_response': final_response,
             'tool_calls': tool_calls,
             'tool_responses': tool_responses,
             'audio_url': audio_url,
             'success': True
-        }
-        
+        })
+
     except Exception as e:
-        st.error(f"Error running agent: {str(e)}")
+        # No st.error here: this runs off the script thread, where it
+        # would render nothing. The failed final dict carries the message
+        # and the consumer settles it into the response slot.
         traceback.print_exc()
-        return {
+        yield ("final", {
             'final_response': f"An error occurred: {str(e)}",
             'tool_calls': [],
             'tool_responses': [],
             'audio_url': None,
             'success': False
-        }
+        })
+
+
+@st.cache_resource
+def get_loop() -> asyncio.AbstractEventLoop:
+    """Return the process-wide background event loop for agent turns.
+
+    The loop runs forever on a daemon thread and is shared by every
+    session: the cached Runner's HTTP and MCP connections are bound to
+    the loop they were opened on, so keeping one loop alive across turns
+    (and sessions) is what lets those pools actually be reused instead of
+    being torn down with a per-turn loop. Built through
+    utils.event_loops so uvloop is used when installed.
+    """
+    loop = new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, name="adk-ui-loop", daemon=True)
+    thread.start()
+    return loop
+
+
+def iter_over_async(agen, loop: asyncio.AbstractEventLoop, timeout: float | None = None):
+    """Drive an async generator from sync Streamlit code, item by item.
+
+    Each __anext__ is scheduled onto the background loop; the sync caller
+    gets the item as soon as it is produced, which is what lets the chat
+    render mid-turn instead of after the full response.
+
+    The pending step is published in st.session_state.inflight so a rerun
+    (e.g. the sidebar Stop button) can cancel it; cancellation ends the
+    iteration cleanly. With a timeout, the whole drive runs against one
+    wallclock deadline and raises TimeoutError on expiry — in both cases
+    the generator is closed on the loop so the runner's turn is released.
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+    try:
+        while True:
+            future = asyncio.run_coroutine_threadsafe(agen.__anext__(), loop)
+            st.session_state.inflight = future
+            remaining = None
+            if deadline is not None:
+                remaining = max(0.0, deadline - time.monotonic())
+            try:
+                yield future.result(timeout=remaining)
+            except StopAsyncIteration:
+                return
+            except concurrent.futures.CancelledError:
+                # Stopped from another rerun; swallow and end the turn.
+                return
+            except concurrent.futures.TimeoutError:
+                future.cancel()
+                raise TimeoutError(
+                    f"Agent turn exceeded {timeout:.0f}s"
+                ) from None
+    finally:
+        st.session_state.inflight = None
+        asyncio.run_coroutine_threadsafe(agen.aclose(), loop)
 
 
 def initialize_session_state():
     """Initialize Streamlit session state variables."""
     if 'session_id' not in st.session_state:
         st.session_state.session_id = f"session-{uuid.uuid4()}"
-    if 'conversation_history' not in st.session_state:
-        st.session_state.conversation_history = []
-    
+
     if 'audio_files' not in st.session_state:
-        st.session_state.audio_files = []
+        # Bounded ring plus a set mirror for O(1) dedup; the deque keeps
+        # the insertion order the sidebar renders.
+        st.session_state.audio_files = deque(maxlen=MAX_AUDIO_FILES)
+        st.session_state.audio_files_seen = set()
+    if 'history_visible' not in st.session_state:
+        st.session_state.history_visible = VISIBLE_MESSAGES
+
+
+def _tool_calls_code(tool_calls: List[Dict[str, Any]]) -> str:
+    """Prebuild the st.code body for a finished message's tool calls.
+
+    Past messages are immutable, so the string is computed once at append
+    time instead of per call on every rerun of the transcript.
+    """
+    return "\n\n".join(
+        f"Tool: {call['name']}\nArguments: {call['args']}" for call in tool_calls
+    )
+
+
+def _tool_responses_text(tool_responses: List[Dict[str, Any]]) -> str:
+    """Prebuild the expander body for a finished message's tool responses."""
+    parts = []
+    for response in tool_responses:
+        body = response['response']
+        if isinstance(body, dict):
+            body = _json_dumps(body)
+        parts.append(f"{response['name']}: {body}")
+    return "\n\n".join(parts)
 
 
 def display_tool_calls(tool_calls: List[Dict[str, Any]]):
@@ -197,6 +456,163 @@ def display_tool_responses(tool_responses: List[Dict[str, Any]]):
                     st.text(str(response['response']))
 
 
+@st.fragment
+def chat_area():
+    """Transcript plus chat input, scoped to fragment reruns.
+
+    Widgets inside this block (chat input, load-older) re-execute only
+    the fragment, not the sidebar or page chrome, so per-interaction
+    work tracks the chat area alone. A full-app rerun is requested
+    explicitly when a turn produces state the sidebar shows (audio).
+    """
+    # Display conversation history, windowed so rerun cost stays O(visible)
+    # even when the stored transcript is much longer.
+    history = get_history_store().tail(st.session_state.session_id)
+    hidden = len(history) - st.session_state.history_visible
+    if hidden > 0 and st.button(f"⬆️ Load older messages ({hidden} hidden)"):
+        st.session_state.history_visible += VISIBLE_MESSAGES
+        hidden = len(history) - st.session_state.history_visible
+    if hidden > 0:
+        history = history[-st.session_state.history_visible:]
+
+    for message in history:
+        with st.chat_message(message["role"]):
+            st.write(message["content"])
+
+            # Past messages carry prebuilt expander bodies; emitting one
+            # string per expander beats re-serializing every tool payload
+            # on every rerun.
+            if message.get("tool_calls_code"):
+                with st.expander(
+                    f"🛠️ Tool Calls ({message['tool_calls_count']})", expanded=False
+                ):
+                    st.code(message["tool_calls_code"], language="python")
+            if message.get("tool_responses_text"):
+                with st.expander(
+                    f"⚡ Tool Responses ({message['tool_responses_count']})", expanded=False
+                ):
+                    st.text(message["tool_responses_text"])
+    
+    # Chat input
+    if prompt := st.chat_input("Ask me to search Notion or create audio..."):
+        # Add user message to history
+        get_history_store().append(st.session_state.session_id, {
+            "role": "user",
+            "content": prompt
+        })
+        
+        # Display user message
+        with st.chat_message("user"):
+            st.write(prompt)
+        
+        # Process with agent, rendering events as they stream in
+        with st.chat_message("assistant"):
+            response_slot = st.empty()
+            tool_calls_slot = st.empty()
+            tool_responses_slot = st.empty()
+
+            # Streamed deltas accumulate in a StringIO: appends are O(delta)
+            # instead of rebuilding the whole string per chunk, and only the
+            # throttled markdown repaint materializes the full text.
+            streamed_buf = io.StringIO()
+            tool_calls_seen: List[Dict[str, Any]] = []
+            tool_responses_seen: List[Dict[str, Any]] = []
+            result = None
+
+            # Resolve the runner here on the script thread (also ensures
+            # the ADK session exists) before handing off to the loop.
+            agen = run_agent_events(
+                get_adk_runner(st.session_state.session_id),
+                prompt,
+                st.session_state.session_id,
+            )
+            with st.spinner("🤔 Agent is thinking and coordinating with child agents..."):
+                try:
+                    for kind, payload in iter_over_async(
+                        agen, get_loop(), timeout=PER_TURN_TIMEOUT
+                    ):
+                        if kind == "chunk":
+                            streamed_buf.write(payload)
+                            response_slot.markdown(streamed_buf.getvalue())
+                        elif kind == "tool_call":
+                            tool_calls_seen.append(payload)
+                            with tool_calls_slot.container():
+                                display_tool_calls(tool_calls_seen)
+                        elif kind == "tool_response":
+                            tool_responses_seen.append(payload)
+                            with tool_responses_slot.container():
+                                display_tool_responses(tool_responses_seen)
+                        else:  # "final"
+                            result = payload
+                except TimeoutError:
+                    result = {
+                        'final_response': f"⏰ Turn timed out after {PER_TURN_TIMEOUT:.0f}s",
+                        'tool_calls': tool_calls_seen,
+                        'tool_responses': tool_responses_seen,
+                        'audio_url': None,
+                        'success': False
+                    }
+
+            if result is None:
+                result = {
+                    'final_response': streamed_buf.getvalue(),
+                    'tool_calls': tool_calls_seen,
+                    'tool_responses': tool_responses_seen,
+                    'audio_url': None,
+                    'success': False
+                }
+
+            # Settle the placeholders on the definitive content, using the
+            # same prebuilt strings the history entry stores below so each
+            # tool payload is serialized exactly once per turn.
+            if result['final_response']:
+                response_slot.markdown(result['final_response'])
+            tool_calls_code = _tool_calls_code(result['tool_calls'])
+            tool_responses_text = _tool_responses_text(result['tool_responses'])
+            with tool_calls_slot.container():
+                if tool_calls_code:
+                    with st.expander(
+                        f"🛠️ Tool Calls ({len(result['tool_calls'])})", expanded=False
+                    ):
+                        st.code(tool_calls_code, language="python")
+            with tool_responses_slot.container():
+                if tool_responses_text:
+                    with st.expander(
+                        f"⚡ Tool Responses ({len(result['tool_responses'])})", expanded=False
+                    ):
+                        st.text(tool_responses_text)
+            
+            # Handle audio if present
+            new_audio = False
+            if result['audio_url']:
+                st.audio(_audio_source(result['audio_url']), format="audio/mp3")
+                # Add to session audio files (set membership, not a list scan)
+                if result['audio_url'] not in st.session_state.audio_files_seen:
+                    audio_files = st.session_state.audio_files
+                    if len(audio_files) == audio_files.maxlen:
+                        # The deque is about to evict its oldest entry.
+                        st.session_state.audio_files_seen.discard(audio_files[0])
+                    st.session_state.audio_files_seen.add(result['audio_url'])
+                    audio_files.append(result['audio_url'])
+                    new_audio = True
+            
+            # Add assistant message to history with its render strings
+            # precomputed once, while the payloads are still in hand.
+            get_history_store().append(st.session_state.session_id, {
+                "role": "assistant",
+                "content": result['final_response'],
+                "tool_calls_code": tool_calls_code,
+                "tool_calls_count": len(result['tool_calls']),
+                "tool_responses_text": tool_responses_text,
+                "tool_responses_count": len(result['tool_responses'])
+            })
+
+            # The audio list lives in the sidebar, outside this fragment;
+            # only a new clip warrants paying for a full-app rerun.
+            if new_audio:
+                st.rerun(scope="app")
+
+
 def main():
     """Main Streamlit application."""
     st.set_page_config(
@@ -205,11 +621,11 @@ def main():
         layout="wide"
     )
     
-    # Get the runner instance (this will be cached after the first run)
-    get_adk_runner()
-    
     # Initialize session state for UI elements
     initialize_session_state()
+
+    # Get this session's runner instance (cached after the first run)
+    get_adk_runner(st.session_state.session_id)
     
     # Main UI
     st.title("🤖 Host Agent Assistant")
@@ -224,68 +640,26 @@ def main():
         st.info("🧠 **Agent Memory**: Context is preserved for this session.")
         
         if st.button("🔄 New Session"):
-            # Clear all session state which triggers re-initialization
+            # Drop this session's transcript from the store, then clear all
+            # session state which triggers re-initialization
+            get_history_store().clear(st.session_state.session_id)
             st.session_state.clear()
             st.rerun()
+
+        # A rerun can land while a turn is still in flight on the
+        # background loop; the button cancels its pending step.
+        inflight = st.session_state.get('inflight')
+        if inflight is not None and not inflight.done():
+            if st.button("⏹ Stop current turn"):
+                inflight.cancel()
         
         # Display audio files
         if st.session_state.audio_files:
             st.header("🎵 Generated Audio")
             for i, audio_url in enumerate(st.session_state.audio_files):
-                st.audio(audio_url, format="audio/mp3")
-    
-    # Display conversation history
-    for message in st.session_state.conversation_history:
-        with st.chat_message(message["role"]):
-            st.write(message["content"])
-            
-            # Show tool interactions if present
-            if "tool_calls" in message:
-                display_tool_calls(message["tool_calls"])
-            if "tool_responses" in message:
-                display_tool_responses(message["tool_responses"])
-    
-    # Chat input
-    if prompt := st.chat_input("Ask me to search Notion or create audio..."):
-        # Add user message to history
-        st.session_state.conversation_history.append({
-            "role": "user",
-            "content": prompt
-        })
-        
-        # Display user message
-        with st.chat_message("user"):
-            st.write(prompt)
-        
-        # Process with agent
-        with st.chat_message("assistant"):
-            with st.spinner("🤔 Agent is thinking and coordinating with child agents..."):
-                # Use asyncio.run to bridge sync UI to async ADK logic
-                result = asyncio.run(run_agent_logic(prompt, st.session_state.session_id))
-            
-            # Display final response
-            if result['final_response']:
-                st.write(result['final_response'])
-            
-            # Show tool interactions
-            display_tool_calls(result['tool_calls'])
-            display_tool_responses(result['tool_responses'])
-            
-            # Handle audio if present
-            if result['audio_url']:
-                st.audio(result['audio_url'], format="audio/mp3")
-                # Add to session audio files
-                if result['audio_url'] not in st.session_state.audio_files:
-                    st.session_state.audio_files.append(result['audio_url'])
-            
-            # Add assistant message to history
-            assistant_message = {
-                "role": "assistant",
-                "content": result['final_response'],
-                "tool_calls": result['tool_calls'],
-                "tool_responses": result['tool_responses']
-            }
-            st.session_state.conversation_history.append(assistant_message)
+                st.audio(_audio_source(audio_url), format="audio/mp3")
+
+    chat_area()
 
 
 if __name__ == "__main__":
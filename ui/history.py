@@ -0,0 +1,92 @@
+"""Conversation-history storage for the Streamlit UIs.
+
+History kept in ``st.session_state`` lives inside one Streamlit process
+and is re-serialized with the rest of the session on every rerun; long
+chats make that cost grow per turn, and a second frontend replica cannot
+see it at all. When ``UI_HISTORY_REDIS_URL`` is set, history moves to a
+Redis list keyed by session id — O(1) appends, server-side trim to a
+bounded length, and shared visibility across replicas. Without the env
+var (the default for this single-process demo) an in-process store with
+the same interface is used, so the UIs never need to know which backend
+is active.
+"""
+
+import os
+from collections import deque
+from typing import Any, Dict, List, Optional
+
+from utils.fast_json import dumps, loads
+
+# Bounds shared by both backends: the ring keeps the most recent turns.
+MAX_TURNS = 200
+TTL_SECONDS = 24 * 3600  # Redis keys for abandoned sessions expire
+
+
+class InProcessHistory:
+    """Bounded per-session history held in this process.
+
+    Messages are plain dicts, matching what the Redis backend stores as
+    JSON, so callers render the same shape either way.
+    """
+
+    def __init__(self) -> None:
+        self._sessions: Dict[str, deque] = {}
+
+    def append(self, session_id: str, message: Dict[str, Any]) -> None:
+        history = self._sessions.get(session_id)
+        if history is None:
+            history = self._sessions.setdefault(session_id, deque(maxlen=MAX_TURNS))
+        history.append(message)
+
+    def tail(self, session_id: str, count: Optional[int] = None) -> List[Dict[str, Any]]:
+        history = self._sessions.get(session_id)
+        if not history:
+            return []
+        items = list(history)
+        if count is not None and count < len(items):
+            return items[-count:]
+        return items
+
+    def clear(self, session_id: str) -> None:
+        self._sessions.pop(session_id, None)
+
+
+class RedisHistory:
+    """History in one Redis list per session.
+
+    Append, trim and TTL refresh travel in a single pipeline, so each
+    turn costs one round trip regardless of history length.
+    """
+
+    def __init__(self, url: str) -> None:
+        import redis  # Imported here: only needed when the env var opts in.
+
+        self._client = redis.Redis.from_url(url)
+
+    @staticmethod
+    def _key(session_id: str) -> str:
+        return f"hist:{session_id}"
+
+    def append(self, session_id: str, message: Dict[str, Any]) -> None:
+        key = self._key(session_id)
+        pipe = self._client.pipeline()
+        pipe.rpush(key, dumps(message))
+        pipe.ltrim(key, -MAX_TURNS, -1)
+        pipe.expire(key, TTL_SECONDS)
+        pipe.execute()
+
+    def tail(self, session_id: str, count: Optional[int] = None) -> List[Dict[str, Any]]:
+        start = -count if count is not None else 0
+        raw_items = self._client.lrange(self._key(session_id), start, -1)
+        return [loads(raw) for raw in raw_items]
+
+    def clear(self, session_id: str) -> None:
+        self._client.delete(self._key(session_id))
+
+
+def create_history_store():
+    """Build the history backend selected by the environment."""
+    url = os.getenv("UI_HISTORY_REDIS_URL", "")
+    if url:
+        return RedisHistory(url)
+    return InProcessHistory()
@@ -0,0 +1,123 @@
+"""Optionally Redis-backed ADK session storage for the Streamlit UI.
+
+``InMemorySessionService`` pins every browser session to one Streamlit
+process: scaling the UI behind a load balancer then needs sticky
+sessions, and abandoned sessions accumulate in process memory forever.
+When ``ADK_SESSION_REDIS_URL`` is set, sessions are serialized to Redis
+under ``adk:{app}:{user}:{session}`` with a TTL, so any replica can
+serve any rerun and stale sessions expire server-side. Without the env
+var (the default for this single-process demo) the stock in-memory
+service is used, mirroring how ``ui.history`` selects its backend.
+"""
+
+import os
+import time
+import uuid
+from typing import Any, Dict, Optional
+
+from google.adk.events import Event
+from google.adk.sessions import BaseSessionService, InMemorySessionService, Session
+from google.adk.sessions.base_session_service import (
+    GetSessionConfig,
+    ListSessionsResponse,
+)
+
+TTL_SECONDS = 24 * 3600  # Keys for abandoned sessions expire
+
+
+class RedisSessionService(BaseSessionService):
+    """ADK sessions stored as JSON blobs in Redis.
+
+    Each session travels as one pydantic-serialized value; a write per
+    appended event and a read per get keep the protocol to one round
+    trip each, and the TTL is refreshed on every write.
+    """
+
+    def __init__(self, url: str) -> None:
+        import redis  # Imported here: only needed when the env var opts in.
+
+        self._client = redis.Redis.from_url(url)
+
+    @staticmethod
+    def _key(app_name: str, user_id: str, session_id: str) -> str:
+        return f"adk:{app_name}:{user_id}:{session_id}"
+
+    def _save(self, session: Session) -> None:
+        self._client.set(
+            self._key(session.app_name, session.user_id, session.id),
+            session.model_dump_json(),
+            ex=TTL_SECONDS,
+        )
+
+    async def create_session(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        state: Optional[Dict[str, Any]] = None,
+        session_id: Optional[str] = None,
+    ) -> Session:
+        session = Session(
+            app_name=app_name,
+            user_id=user_id,
+            id=session_id or uuid.uuid4().hex,
+            state=state or {},
+            last_update_time=time.time(),
+        )
+        self._save(session)
+        return session
+
+    async def get_session(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        session_id: str,
+        config: Optional[GetSessionConfig] = None,
+    ) -> Optional[Session]:
+        raw = self._client.get(self._key(app_name, user_id, session_id))
+        if raw is None:
+            return None
+        session = Session.model_validate_json(raw)
+        if config is not None:
+            if config.num_recent_events:
+                session.events = session.events[-config.num_recent_events:]
+            elif config.after_timestamp:
+                session.events = [
+                    event
+                    for event in session.events
+                    if event.timestamp >= config.after_timestamp
+                ]
+        return session
+
+    async def list_sessions(
+        self, *, app_name: str, user_id: str
+    ) -> ListSessionsResponse:
+        sessions = []
+        for key in self._client.scan_iter(match=f"adk:{app_name}:{user_id}:*"):
+            raw = self._client.get(key)
+            if raw is None:
+                continue
+            session = Session.model_validate_json(raw)
+            session.events = []  # Listing returns metadata, not transcripts
+            sessions.append(session)
+        return ListSessionsResponse(sessions=sessions)
+
+    async def delete_session(
+        self, *, app_name: str, user_id: str, session_id: str
+    ) -> None:
+        self._client.delete(self._key(app_name, user_id, session_id))
+
+    async def append_event(self, session: Session, event: Event) -> Event:
+        event = await super().append_event(session, event)
+        session.last_update_time = event.timestamp
+        self._save(session)
+        return event
+
+
+def create_session_service() -> BaseSessionService:
+    """Build the session service selected by the environment."""
+    url = os.getenv("ADK_SESSION_REDIS_URL", "")
+    if url:
+        return RedisSessionService(url)
+    return InMemorySessionService()
@@ -0,0 +1,25 @@
+"""uvloop-backed event loop construction for the background loop threads.
+
+Both Streamlit UIs drive their agent turns on a long-lived loop in a
+daemon thread; every streamed token and MCP round trip pays that loop's
+dispatch overhead. uvloop's libuv-based loop is a drop-in replacement
+that cuts this per-event cost substantially. Loops are built directly
+instead of via ``asyncio.set_event_loop_policy`` so the choice stays
+local to the callers and never leaks into other code's ``asyncio.run``.
+If uvloop is not installed (e.g. on Windows, where it does not build)
+the stdlib loop is used unchanged.
+"""
+
+import asyncio
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - exercised only without uvloop
+    uvloop = None
+
+
+def new_event_loop() -> asyncio.AbstractEventLoop:
+    """Return a new event loop, preferring uvloop when available."""
+    if uvloop is not None:
+        return uvloop.new_event_loop()
+    return asyncio.new_event_loop()
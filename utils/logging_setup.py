@@ -0,0 +1,26 @@
+"""Process-wide logging configuration.
+
+Entry points call :func:`configure` exactly once; library modules should only
+create their own ``logging.getLogger(__name__)`` and never touch the root
+configuration. This replaces the scattered ``logging.basicConfig`` calls,
+which were no-ops after the first import but still took the logging lock and
+walked the handler list on every subsequent call.
+"""
+
+import logging
+
+_configured = False
+
+
+def configure(level: int = logging.INFO) -> None:
+    """Configure root logging once per process.
+
+    Args:
+        level: Root log level; defaults to INFO to match the previous
+            per-module basicConfig calls.
+    """
+    global _configured
+    if _configured:
+        return
+    logging.basicConfig(level=level)
+    _configured = True